@@ -0,0 +1,238 @@
+"""Quantized point storage."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Sequence
+from math import sqrt
+
+from .errors import Vector3ArgumentError
+from .matrix3 import Matrix3
+from .vector3 import Vector3
+
+
+class CompressedPoints(object):
+    """Provides compact storage of many points quantized to 16 or 32 bit integers.
+
+    Notes:
+        - Points are split into blocks of block_size points. Each block stores its bounding box
+          minimum and the quantization step per axis, every coordinate is stored as an unsigned
+          integer code so that value = minimum + code * step.
+        - With 16 bits a point takes 6 bytes instead of 24 bytes in a float array.
+        - Batch operations decode one block at a time straight from the codes, the full float
+          array is never built. Operations that return CompressedPoints re-quantize each block
+          and carry the error of their input forward, so error_bound stays valid through chains.
+
+    """
+    __slots__ = ("_bits", "_block_size", "_levels", "_codes", "_minimums", "_steps", "_carried_error")
+    _TYPECODES = {16: "H", 32: "I"}
+
+    def __init__(self, points: Sequence[float] = (), bits: int = 16, block_size: int = 1024):
+        """Initialization of CompressedPoints class.
+
+        Args:
+            points: flat x, y, z float per point.
+            bits: bits per coordinate, 16 or 32.
+            block_size: points per quantization block.
+
+        Raises:
+            ValueError: If bits or block_size is invalid or points is not a multiple of three.
+        """
+        if bits not in self._TYPECODES:
+            raise ValueError(f"bits must be one of {tuple(self._TYPECODES)}. Got: {bits}")
+        if block_size < 1:
+            raise ValueError(f"block_size must be at least 1. Got: {block_size}")
+        if len(points) % 3:
+            raise ValueError("points must contain three floats per point.")
+        self._bits = bits
+        self._block_size = block_size
+        self._levels = (1 << bits) - 1
+        self._codes = array(self._TYPECODES[bits])
+        self._minimums = array("d")
+        self._steps = array("d")
+        # error already present in the values that were quantized, set by operations on other CompressedPoints.
+        self._carried_error = 0.0
+        stride = block_size * 3
+        for start in range(0, len(points), stride):
+            self._append_block(points[start:start + stride])
+
+    def __repr__(self) -> str:
+        return f"CompressedPoints: [{len(self)} points, {self._bits} bits]"
+
+    def __len__(self) -> int:
+        """Return the number of points."""
+        return len(self._codes) // 3
+
+    def __getitem__(self, index: int) -> Vector3:
+        """Return a single decoded point."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("point index out of range.")
+        b = (index // self._block_size) * 3
+        c = index * 3
+        return Vector3(self._minimums[b] + self._codes[c] * self._steps[b],
+                       self._minimums[b + 1] + self._codes[c + 1] * self._steps[b + 1],
+                       self._minimums[b + 2] + self._codes[c + 2] * self._steps[b + 2])
+
+    @property
+    def bits(self) -> int:
+        """Bits per stored coordinate."""
+        return self._bits
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the codes and per block ranges."""
+        return (len(self._codes) * self._codes.itemsize
+                + (len(self._minimums) + len(self._steps)) * self._minimums.itemsize)
+
+    @property
+    def error_bound(self) -> float:
+        """Largest absolute error of any decoded coordinate against the exact result.
+
+        Note:
+            This is half the largest quantization step of these points plus the error carried
+            over from the CompressedPoints they were computed from, so after transformed() or
+            normalized() it bounds the error against applying the same operations to the
+            original floats. It is a single worst case for the whole container, after
+            normalized() it is set by the shortest non-zero point, see normalized.
+        """
+        return max(self._steps, default=0.0) * 0.5 + self._carried_error
+
+    def blocks(self) -> Iterator[array]:
+        """Yield the decoded points of each block as a flat x, y, z float array."""
+        for block in range(len(self._minimums) // 3):
+            yield self._decode_block(block)
+
+    def decode(self) -> array:
+        """Return every point decoded into one flat x, y, z float array."""
+        out = array("d")
+        for values in self.blocks():
+            out.extend(values)
+        return out
+
+    def transformed(self, rotation: Matrix3, translation: Vector3 = None) -> CompressedPoints:
+        """Return the points rotated and then translated.
+
+        Args:
+            rotation: rotation (or any linear transform) to apply.
+            translation: optional translation applied after rotation.
+
+        Note:
+            The block minimum and step are folded into one affine transform per block,
+            so each point is transformed straight from its integer codes.
+            The input error is carried into the result scaled by the largest absolute row sum
+            of rotation, which bounds how much a per coordinate error can grow.
+        """
+        if not Matrix3._type_check(rotation):
+            raise TypeError(Matrix3._ERRORS[0])
+        if translation is not None and not isinstance(translation, Vector3):
+            raise Vector3ArgumentError(invalid_type=type(translation))
+        r = rotation.as_list()
+        tx, ty, tz = translation.as_tuple() if translation is not None else (0.0, 0.0, 0.0)
+        result = CompressedPoints((), bits=self._bits, block_size=self._block_size)
+        result._carried_error = self.error_bound * max(abs(r[0]) + abs(r[1]) + abs(r[2]),
+                                                       abs(r[3]) + abs(r[4]) + abs(r[5]),
+                                                       abs(r[6]) + abs(r[7]) + abs(r[8]))
+        codes = self._codes
+        for block in range(len(self._minimums) // 3):
+            b = block * 3
+            mx, my, mz = self._minimums[b:b + 3]
+            sx, sy, sz = self._steps[b:b + 3]
+            # R * (minimum + step * code) + t = (R * minimum + t) + (R * diag(step)) * code
+            ox = r[0] * mx + r[1] * my + r[2] * mz + tx
+            oy = r[3] * mx + r[4] * my + r[5] * mz + ty
+            oz = r[6] * mx + r[7] * my + r[8] * mz + tz
+            a0, a1, a2 = r[0] * sx, r[1] * sy, r[2] * sz
+            a3, a4, a5 = r[3] * sx, r[4] * sy, r[5] * sz
+            a6, a7, a8 = r[6] * sx, r[7] * sy, r[8] * sz
+            out = array("d")
+            for c in range(*self._block_range(block)):
+                x, y, z = codes[c], codes[c + 1], codes[c + 2]
+                out.extend((ox + a0 * x + a1 * y + a2 * z,
+                            oy + a3 * x + a4 * y + a5 * z,
+                            oz + a6 * x + a7 * y + a8 * z))
+            result._append_block(out)
+        return result
+
+    def distances_to(self, point: Vector3) -> array:
+        """Return the distance from every point to point.
+
+        Args:
+            point: point to measure distances to.
+        """
+        if not isinstance(point, Vector3):
+            raise Vector3ArgumentError(invalid_type=type(point))
+        px, py, pz = point.as_tuple()
+        codes = self._codes
+        out = array("d")
+        for block in range(len(self._minimums) // 3):
+            b = block * 3
+            ox, oy, oz = self._minimums[b] - px, self._minimums[b + 1] - py, self._minimums[b + 2] - pz
+            sx, sy, sz = self._steps[b:b + 3]
+            for c in range(*self._block_range(block)):
+                x = ox + codes[c] * sx
+                y = oy + codes[c + 1] * sy
+                z = oz + codes[c + 2] * sz
+                out.append(sqrt(x * x + y * y + z * z))
+        return out
+
+    def normalized(self) -> CompressedPoints:
+        """Return every point scaled to unit length, zero length points stay at the origin.
+
+        Note:
+            A point off by at most d in distance normalizes to within 2 * d / length of the exact
+            unit vector, so the carried error is taken from the shortest non-zero point and
+            capped at 2. Points that decode to exactly zero are taken to be exactly zero and do
+            not count. error_bound is one value for all points, so a single non-zero point close
+            to the origin raises it for every point, up to 2 once its length nears d.
+        """
+        result = CompressedPoints((), bits=self._bits, block_size=self._block_size)
+        shortest = float("inf")
+        for values in self.blocks():
+            for i in range(0, len(values), 3):
+                x, y, z = values[i], values[i + 1], values[i + 2]
+                length = sqrt(x * x + y * y + z * z)
+                if length > 0.0:
+                    shortest = min(shortest, length)
+                    values[i] = x / length
+                    values[i + 1] = y / length
+                    values[i + 2] = z / length
+            result._append_block(values)
+        error = self.error_bound
+        if error > 0.0:
+            distance = sqrt(3.0) * error
+            result._carried_error = min(2.0, 2.0 * distance / shortest)
+        return result
+
+    def _block_range(self, block: int) -> tuple[int, int, int]:
+        """Return the start, stop and step of the codes of block."""
+        start = block * self._block_size * 3
+        return start, min(start + self._block_size * 3, len(self._codes)), 3
+
+    def _decode_block(self, block: int) -> array:
+        """Return the points of block as a flat x, y, z float array."""
+        b = block * 3
+        mx, my, mz = self._minimums[b:b + 3]
+        sx, sy, sz = self._steps[b:b + 3]
+        codes = self._codes
+        out = array("d")
+        for c in range(*self._block_range(block)):
+            out.extend((mx + codes[c] * sx, my + codes[c + 1] * sy, mz + codes[c + 2] * sz))
+        return out
+
+    def _append_block(self, points: Sequence[float]) -> None:
+        """Quantize up to block_size points as a new block."""
+        levels = self._levels
+        for axis in range(3):
+            values = points[axis::3]
+            low, high = min(values), max(values)
+            self._minimums.append(float(low))
+            self._steps.append((high - low) / levels)
+        b = len(self._minimums) - 3
+        inverse = [1.0 / step if step > 0.0 else 0.0 for step in self._steps[b:b + 3]]
+        minimums = self._minimums[b:b + 3]
+        codes = self._codes
+        for i in range(len(points)):
+            axis = i % 3
+            code = int((points[i] - minimums[axis]) * inverse[axis] + 0.5)
+            codes.append(code if code < levels else levels)
@@ -0,0 +1,169 @@
+"""3x3 matrix decomposition functions."""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from math import sqrt
+
+from .matrix3 import Matrix3
+
+_IDENTITY = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
+# Jacobi sweeps needed by a 3x3 symmetric matrix rarely exceed 6, this only bounds pathological input.
+_MAX_SWEEPS = 24
+_EPSILON = 1e-12
+
+
+def svd(matrix3: Matrix3) -> tuple[Matrix3, tuple[float, float, float], Matrix3]:
+    """Compute the signed singular value decomposition of a Matrix3.
+
+    matrix3 = U * diag(s) * transpose(V)
+
+    Args:
+        matrix3: matrix to decompose.
+
+    Returns:
+        tuple: U, singular values and V.
+
+    Note:
+        U and V are always proper rotations (determinant 1). The singular values are sorted
+        s1 >= s2 >= abs(s3) and s3 carries the sign of the determinant, so reflections
+        show up as a negative s3 instead of as a reflected U or V.
+    """
+    if not Matrix3._type_check(matrix3):
+        raise TypeError(Matrix3._ERRORS[0])
+    u, s, v = _svd(matrix3.as_list())
+    return Matrix3(*u), s, Matrix3(*v)
+
+
+def polar(matrix3: Matrix3) -> tuple[Matrix3, Matrix3]:
+    """Compute the polar decomposition of a Matrix3.
+
+    matrix3 = rotation * stretch
+
+    Args:
+        matrix3: matrix to decompose.
+
+    Returns:
+        tuple: rotation and symmetric stretch Matrix3.
+
+    Note:
+        The rotation is the closest proper rotation to matrix3. If matrix3 contains a
+        reflection the stretch has one negative eigenvalue.
+    """
+    if not Matrix3._type_check(matrix3):
+        raise TypeError(Matrix3._ERRORS[0])
+    u, s, v = _svd(matrix3.as_list())
+    rotation = _multiply_transposed(u, v)
+    stretch = [0.0] * 9
+    for row in range(3):
+        for column in range(3):
+            stretch[row * 3 + column] = sum(v[row * 3 + k] * s[k] * v[column * 3 + k] for k in range(3))
+    return Matrix3(*rotation), Matrix3(*stretch)
+
+
+def _polar_rotation(m: Sequence[float]) -> tuple[float, ...]:
+    """Return the closest proper rotation to a flat row major matrix."""
+    u, _, v = _svd(m)
+    return _multiply_transposed(u, v)
+
+
+def _svd(m: Sequence[float]) -> tuple[tuple[float, ...], tuple[float, float, float], tuple[float, ...]]:
+    """Signed singular value decomposition of a flat row major matrix, see svd.
+
+    Note:
+        V comes from the Jacobi eigen decomposition of transpose(m) * m. The columns of U are
+        m * v1 and m * v2 orthonormalized, with u3 = u1 x u2 so U is always a rotation.
+    """
+    m0, m1, m2, m3, m4, m5, m6, m7, m8 = m
+    ata = (m0 * m0 + m3 * m3 + m6 * m6, m0 * m1 + m3 * m4 + m6 * m7, m0 * m2 + m3 * m5 + m6 * m8,
+           0.0, m1 * m1 + m4 * m4 + m7 * m7, m1 * m2 + m4 * m5 + m7 * m8,
+           0.0, 0.0, m2 * m2 + m5 * m5 + m8 * m8)
+    values, vectors = _symmetric_eigen(ata)
+
+    order = sorted(range(3), key=values.__getitem__, reverse=True)
+    v = [vectors[row * 3 + k] for row in range(3) for k in order]
+    # make V a proper rotation by flipping its last column if needed.
+    if _determinant(v) < 0.0:
+        v[2], v[5], v[8] = -v[2], -v[5], -v[8]
+
+    # b_k = m * v_k
+    b = [[m[row * 3] * v[k] + m[row * 3 + 1] * v[3 + k] + m[row * 3 + 2] * v[6 + k] for row in range(3)]
+         for k in range(3)]
+    s1 = sqrt(b[0][0] * b[0][0] + b[0][1] * b[0][1] + b[0][2] * b[0][2])
+    if s1 < _EPSILON:
+        return tuple(v), (0.0, 0.0, 0.0), tuple(v)
+    u1 = [x / s1 for x in b[0]]
+
+    d = u1[0] * b[1][0] + u1[1] * b[1][1] + u1[2] * b[1][2]
+    u2 = [b[1][k] - d * u1[k] for k in range(3)]
+    length = sqrt(u2[0] * u2[0] + u2[1] * u2[1] + u2[2] * u2[2])
+    if length < _EPSILON * s1:
+        u2 = _perpendicular(u1)
+    else:
+        u2 = [x / length for x in u2]
+    u3 = [u1[1] * u2[2] - u1[2] * u2[1], u1[2] * u2[0] - u1[0] * u2[2], u1[0] * u2[1] - u1[1] * u2[0]]
+
+    s2 = u2[0] * b[1][0] + u2[1] * b[1][1] + u2[2] * b[1][2]
+    s3 = u3[0] * b[2][0] + u3[1] * b[2][1] + u3[2] * b[2][2]
+    u = (u1[0], u2[0], u3[0],
+         u1[1], u2[1], u3[1],
+         u1[2], u2[2], u3[2])
+    return u, (s1, s2, s3), tuple(v)
+
+
+def _symmetric_eigen(a: Sequence[float]) -> tuple[list[float], list[float]]:
+    """Jacobi eigen decomposition of a symmetric matrix given by its upper triangle.
+
+    Returns:
+        tuple: three eigenvalues and a flat row major matrix with the matching eigenvectors as columns.
+    """
+    a = [a[0], a[1], a[2], a[1], a[4], a[5], a[2], a[5], a[8]]
+    v = list(_IDENTITY)
+    scale = a[0] * a[0] + a[4] * a[4] + a[8] * a[8] + 2.0 * (a[1] * a[1] + a[2] * a[2] + a[5] * a[5])
+    for _ in range(_MAX_SWEEPS):
+        if a[1] * a[1] + a[2] * a[2] + a[5] * a[5] <= 1e-30 * scale:
+            break
+        for p, q in ((0, 1), (0, 2), (1, 2)):
+            apq = a[p * 3 + q]
+            if apq == 0.0:
+                continue
+            theta = (a[q * 4] - a[p * 4]) / (2.0 * apq)
+            t = 1.0 / (abs(theta) + sqrt(theta * theta + 1.0))
+            if theta < 0.0:
+                t = -t
+            c = 1.0 / sqrt(t * t + 1.0)
+            s = t * c
+            for k in range(3):
+                akp, akq = a[k * 3 + p], a[k * 3 + q]
+                a[k * 3 + p] = c * akp - s * akq
+                a[k * 3 + q] = s * akp + c * akq
+            for k in range(3):
+                apk, aqk = a[p * 3 + k], a[q * 3 + k]
+                a[p * 3 + k] = c * apk - s * aqk
+                a[q * 3 + k] = s * apk + c * aqk
+            for k in range(3):
+                vkp, vkq = v[k * 3 + p], v[k * 3 + q]
+                v[k * 3 + p] = c * vkp - s * vkq
+                v[k * 3 + q] = s * vkp + c * vkq
+    return [a[0], a[4], a[8]], v
+
+
+def _multiply_transposed(a: Sequence[float], b: Sequence[float]) -> tuple[float, ...]:
+    """Return a * transpose(b) for flat row major matrices."""
+    return tuple(a[row * 3] * b[column * 3] + a[row * 3 + 1] * b[column * 3 + 1] + a[row * 3 + 2] * b[column * 3 + 2]
+                 for row in range(3) for column in range(3))
+
+
+def _determinant(m: Sequence[float]) -> float:
+    """Return the determinant of a flat row major matrix."""
+    a, b, c, d, e, f, g, h, i = m
+    return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+
+
+def _perpendicular(n: Sequence[float]) -> list[float]:
+    """Return a unit vector perpendicular to the unit vector n."""
+    if abs(n[0]) < 0.9:
+        x, y, z = 0.0, -n[2], n[1]
+    else:
+        x, y, z = n[2], 0.0, -n[0]
+    length = sqrt(x * x + y * y + z * z)
+    return [x / length, y / length, z / length]
@@ -0,0 +1,299 @@
+"""Immutable, hashable Vector3 and Matrix3 classes."""
+from __future__ import annotations
+
+from math import sqrt
+from weakref import WeakValueDictionary
+
+from .errors import Vector3ArgumentError, NumTypeArgumentError
+from .matrix3 import Matrix3
+from .vector3 import Vector3
+
+# canonical instances keyed on (class, components), entries drop out once nothing else references them.
+_INTERNED = WeakValueDictionary()
+
+
+class FrozenVector3(object):
+    """Provides an immutable, hashable counterpart of Vector3.
+
+    Notes:
+        - Accepts the same arguments as Vector3.
+        - The hash is computed once at construction so FrozenVector3 is cheap to use as a dict key.
+        - Arithmetic returns new FrozenVector3 objects.
+        - intern() returns a shared instance for equal values, see ZERO, X_AXIS, Y_AXIS and Z_AXIS.
+
+    """
+    __slots__ = ("_x", "_y", "_z", "_hash", "__weakref__")
+    _ACCEPTED_TYPES = (int, float)
+
+    ZERO: FrozenVector3
+    X_AXIS: FrozenVector3
+    Y_AXIS: FrozenVector3
+    Z_AXIS: FrozenVector3
+
+    def __init__(self,
+                 x: float | int | tuple | list = None,
+                 y: float | int = None,
+                 z: float | int = None):
+        """Initialization of FrozenVector3 class.
+
+        Args:
+            x: X value, single value or length three tuple/list, see Vector3.
+            y: Y value.
+            z: Z value.
+
+        Raises:
+            Vector3ComponentArgumentError: If arguments provided are incorrect.
+        """
+        self._set(*Vector3(x, y, z).as_tuple())
+
+    def _set(self, x: float, y: float, z: float) -> None:
+        """Assign components and hash, bypassing the immutability guard."""
+        object.__setattr__(self, "_x", x)
+        object.__setattr__(self, "_y", y)
+        object.__setattr__(self, "_z", z)
+        object.__setattr__(self, "_hash", hash((x, y, z)))
+
+    @classmethod
+    def _from_floats(cls, x: float, y: float, z: float) -> FrozenVector3:
+        """Create a FrozenVector3 from already validated floats."""
+        obj = cls.__new__(cls)
+        obj._set(x, y, z)
+        return obj
+
+    @classmethod
+    def from_vector3(cls, vector3: Vector3, intern: bool = False) -> FrozenVector3:
+        """Create a FrozenVector3 from a Vector3.
+
+        Args:
+            vector3: Vector3 to freeze.
+            intern: return the shared instance for this value.
+
+        Raises:
+            Vector3ArgumentError: If vector3 is not a Vector3.
+        """
+        if not isinstance(vector3, Vector3):
+            raise Vector3ArgumentError(invalid_type=type(vector3))
+        obj = cls._from_floats(*vector3.as_tuple())
+        return obj.intern() if intern else obj
+
+    def to_vector3(self) -> Vector3:
+        """Return a mutable Vector3 copy."""
+        return Vector3(self._x, self._y, self._z)
+
+    def intern(self) -> FrozenVector3:
+        """Return the shared instance equal to this FrozenVector3, registering self if there is none."""
+        key = (FrozenVector3, self._x, self._y, self._z)
+        return _INTERNED.setdefault(key, self)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __reduce__(self):
+        return type(self)._from_floats, (self._x, self._y, self._z)
+
+    def __repr__(self) -> str:
+        return f"FrozenVector3: [{self._x}, {self._y}, {self._z}]"
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, FrozenVector3):
+            return NotImplemented
+        return self._hash == other._hash and (self._x, self._y, self._z) == (other._x, other._y, other._z)
+
+    def __iter__(self):
+        return iter((self._x, self._y, self._z))
+
+    def __add__(self, other: FrozenVector3) -> FrozenVector3:
+        """Add another FrozenVector3 and return a new FrozenVector3."""
+        if not isinstance(other, FrozenVector3):
+            raise Vector3ArgumentError(invalid_type=type(other))
+        return FrozenVector3._from_floats(self._x + other._x, self._y + other._y, self._z + other._z)
+
+    def __sub__(self, other: FrozenVector3) -> FrozenVector3:
+        """Subtract another FrozenVector3 and return a new FrozenVector3."""
+        if not isinstance(other, FrozenVector3):
+            raise Vector3ArgumentError(invalid_type=type(other))
+        return FrozenVector3._from_floats(self._x - other._x, self._y - other._y, self._z - other._z)
+
+    def __mul__(self, other: int | float) -> FrozenVector3:
+        """Multiply by a number and return a new FrozenVector3."""
+        if not isinstance(other, self._ACCEPTED_TYPES):
+            raise NumTypeArgumentError(invalid_type=type(other))
+        return FrozenVector3._from_floats(self._x * other, self._y * other, self._z * other)
+
+    def __truediv__(self, other: int | float) -> FrozenVector3:
+        """Divide by a number and return a new FrozenVector3."""
+        if not isinstance(other, self._ACCEPTED_TYPES):
+            raise NumTypeArgumentError(invalid_type=type(other))
+        return FrozenVector3._from_floats(self._x / other, self._y / other, self._z / other)
+
+    @property
+    def x(self) -> float:
+        """X component of FrozenVector3."""
+        return self._x
+
+    @property
+    def y(self) -> float:
+        """Y component of FrozenVector3."""
+        return self._y
+
+    @property
+    def z(self) -> float:
+        """Z component of FrozenVector3."""
+        return self._z
+
+    @property
+    def magnitude(self) -> float:
+        """Return the length of the FrozenVector3."""
+        return sqrt(self._x * self._x + self._y * self._y + self._z * self._z)
+
+    def as_tuple(self) -> tuple[float, float, float]:
+        """Return this FrozenVector3's components as a X, Y, Z tuple."""
+        return self._x, self._y, self._z
+
+    def cross(self, other: FrozenVector3) -> FrozenVector3:
+        """Return the cross product between this FrozenVector3 and an incoming FrozenVector3."""
+        return FrozenVector3._from_floats(self._y * other.z - self._z * other.y,
+                                          self._z * other.x - self._x * other.z,
+                                          self._x * other.y - self._y * other.x)
+
+    def dot(self, other: FrozenVector3) -> float:
+        """Return the dot product between this FrozenVector3 and another FrozenVector3."""
+        return self._x * other.x + self._y * other.y + self._z * other.z
+
+    def normalized(self) -> FrozenVector3:
+        """Return a normalized copy of this FrozenVector3."""
+        m = self.magnitude
+        return FrozenVector3._from_floats(self._x / m, self._y / m, self._z / m)
+
+
+class FrozenMatrix3(object):
+    """Provides an immutable, hashable counterpart of Matrix3.
+
+    Notes:
+        - Accepts the same arguments as Matrix3.
+        - The hash is computed once at construction so FrozenMatrix3 is cheap to use as a dict key.
+        - intern() returns a shared instance for equal values, see IDENTITY.
+
+    """
+    __slots__ = ("_values", "_hash", "__weakref__")
+
+    IDENTITY: FrozenMatrix3
+
+    def __init__(self, *values):
+        """Initialization of FrozenMatrix3 class.
+
+        Args:
+            *values (float, int, tuple, list): values for matrix initialization, see Matrix3.
+        """
+        self._set(tuple(Matrix3(*values).as_list()))
+
+    def _set(self, values: tuple) -> None:
+        """Assign values and hash, bypassing the immutability guard."""
+        object.__setattr__(self, "_values", values)
+        object.__setattr__(self, "_hash", hash(values))
+
+    @classmethod
+    def _from_floats(cls, *values: float) -> FrozenMatrix3:
+        """Create a FrozenMatrix3 from nine already validated floats."""
+        obj = cls.__new__(cls)
+        obj._set(values)
+        return obj
+
+    @classmethod
+    def from_matrix3(cls, matrix3: Matrix3, intern: bool = False) -> FrozenMatrix3:
+        """Create a FrozenMatrix3 from a Matrix3.
+
+        Args:
+            matrix3: Matrix3 to freeze.
+            intern: return the shared instance for this value.
+        """
+        if not Matrix3._type_check(matrix3):
+            raise TypeError(Matrix3._ERRORS[0])
+        obj = cls._from_floats(*matrix3.as_list())
+        return obj.intern() if intern else obj
+
+    def to_matrix3(self) -> Matrix3:
+        """Return a mutable Matrix3 copy."""
+        return Matrix3(*self._values)
+
+    def intern(self) -> FrozenMatrix3:
+        """Return the shared instance equal to this FrozenMatrix3, registering self if there is none."""
+        return _INTERNED.setdefault((FrozenMatrix3, *self._values), self)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __reduce__(self):
+        return type(self)._from_floats, self._values
+
+    def __repr__(self) -> str:
+        return "FrozenMatrix3: [{0}, {1}, {2}]".format(self.row_1, self.row_2, self.row_3)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, FrozenMatrix3):
+            return NotImplemented
+        return self._hash == other._hash and self._values == other._values
+
+    @property
+    def row_1(self) -> tuple[float, float, float]:
+        """tuple: three floats making up first row."""
+        return self._values[0:3]
+
+    @property
+    def row_2(self) -> tuple[float, float, float]:
+        """tuple: three floats making up second row."""
+        return self._values[3:6]
+
+    @property
+    def row_3(self) -> tuple[float, float, float]:
+        """tuple: three floats making up third row."""
+        return self._values[6:9]
+
+    def as_tuple(self) -> tuple[float, ...]:
+        """Return this matrix as a flattened tuple."""
+        return self._values
+
+    def as_list(self) -> list[float]:
+        """Return this matrix as a flattened list."""
+        return list(self._values)
+
+    def column(self, row: int, column: int) -> float:
+        """Return a given value from a row and column. Indexing start at 0."""
+        if type(row) is not int or type(column) is not int:
+            raise TypeError(Matrix3._ERRORS[4])
+        if row > 2 or row < 0 or column > 2 or column < 0:
+            raise ValueError(Matrix3._ERRORS[5])
+        return self._values[row * 3 + column]
+
+    def determinant(self) -> float:
+        """Return the determinant of the matrix."""
+        a, b, c, d, e, f, g, h, i = self._values
+        return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+
+    def transpose(self) -> FrozenMatrix3:
+        """Return the transposed matrix."""
+        a, b, c, d, e, f, g, h, i = self._values
+        return FrozenMatrix3._from_floats(a, d, g, b, e, h, c, f, i)
+
+
+FrozenVector3.ZERO = FrozenVector3._from_floats(0.0, 0.0, 0.0).intern()
+FrozenVector3.X_AXIS = FrozenVector3._from_floats(1.0, 0.0, 0.0).intern()
+FrozenVector3.Y_AXIS = FrozenVector3._from_floats(0.0, 1.0, 0.0).intern()
+FrozenVector3.Z_AXIS = FrozenVector3._from_floats(0.0, 0.0, 1.0).intern()
+FrozenMatrix3.IDENTITY = FrozenMatrix3._from_floats(1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0).intern()
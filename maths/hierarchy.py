@@ -0,0 +1,279 @@
+"""Transform hierarchy class."""
+from __future__ import annotations
+
+from array import array
+
+from .errors import Vector3ArgumentError
+from .matrix3 import Matrix3
+from .vector3 import Vector3
+
+_IDENTITY = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
+_ROTATION_ORDERS = ("xyz", "zyx")
+
+
+class TransformHierarchy(object):
+    """Provides a parent/child hierarchy of rotation Matrix3 and translation Vector3 transforms.
+
+    Notes:
+        - Nodes are stored in flat arrays indexed by node id, parents are always added before children.
+        - World transforms are cached and only recomputed for nodes whose local transform
+          (or the local transform of an ancestor) changed since the last update.
+        - Dirty nodes are evaluated breadth-first one depth level at a time, so every parent
+          is resolved before any of its children.
+        - Transforms follow the column vector convention of Matrix3.rotation_matrix:
+          world_rotation = parent_rotation * local_rotation
+          world_translation = parent_rotation * local_translation + parent_translation
+
+    """
+    __slots__ = ("_parents", "_depths", "_children",
+                 "_local_rotations", "_local_translations",
+                 "_world_rotations", "_world_translations",
+                 "_dirty", "_pending")
+
+    def __init__(self):
+        """Initialization of TransformHierarchy class."""
+        self._parents = array("l")
+        self._depths = array("l")
+        self._children: list[list[int]] = []
+        self._local_rotations = array("d")
+        self._local_translations = array("d")
+        self._world_rotations = array("d")
+        self._world_translations = array("d")
+        self._dirty = bytearray()
+        self._pending: list[int] = []
+
+    def __repr__(self) -> str:
+        return f"TransformHierarchy: [{len(self._parents)} nodes]"
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def add_node(self,
+                 parent: int = -1,
+                 rotation: tuple | list = None,
+                 translation: Vector3 = None,
+                 rotation_order: str = "zyx") -> int:
+        """Add a node to the hierarchy and return its index.
+
+        Args:
+            parent: index of the parent node, -1 for a root node.
+            rotation: optional local XYZ rotation in degrees, see Matrix3.rotation_matrix.
+            translation: optional local translation.
+            rotation_order: order of rotation 'xyz', 'zyx'.
+
+        Raises:
+            IndexError: If parent is not an existing node.
+            ValueError: If rotation_order is not 'xyz' or 'zyx'.
+            Vector3ArgumentError: If translation is not a Vector3.
+
+        Note:
+            Every argument is validated before the node is appended, so a failed call leaves
+            the hierarchy unchanged.
+        """
+        index = len(self._parents)
+        if parent != -1 and not 0 <= parent < index:
+            raise IndexError(f"parent {parent} is not a node of this hierarchy.")
+        local_rotation = _rotation_values(rotation, rotation_order) if rotation is not None else _IDENTITY
+        local_translation = (0.0, 0.0, 0.0)
+        if translation is not None:
+            if not isinstance(translation, Vector3):
+                raise Vector3ArgumentError(invalid_type=type(translation))
+            local_translation = translation.as_tuple()
+
+        self._parents.append(parent)
+        self._depths.append(self._depths[parent] + 1 if parent != -1 else 0)
+        self._children.append([])
+        if parent != -1:
+            self._children[parent].append(index)
+
+        self._local_rotations.extend(local_rotation)
+        self._local_translations.extend(local_translation)
+        self._world_rotations.extend(_IDENTITY)
+        self._world_translations.extend((0.0, 0.0, 0.0))
+        self._dirty.append(0)
+        self._mark_dirty(index)
+        return index
+
+    def parent(self, index: int) -> int:
+        """Return the parent index of a node, -1 for root nodes."""
+        self._check_index(index)
+        return self._parents[index]
+
+    def children(self, index: int) -> tuple[int, ...]:
+        """Return the child indices of a node."""
+        self._check_index(index)
+        return tuple(self._children[index])
+
+    def depth(self, index: int) -> int:
+        """Return how many ancestors a node has."""
+        self._check_index(index)
+        return self._depths[index]
+
+    def set_local_rotation(self, index: int, rotation: tuple | list, rotation_order: str = "zyx") -> None:
+        """Set the local rotation of a node from XYZ rotation in degrees.
+
+        Args:
+            index: node to set.
+            rotation: XYZ rotation in degrees.
+            rotation_order: order of rotation 'xyz', 'zyx'.
+
+        Raises:
+            IndexError: If index is not a node of this hierarchy.
+            ValueError: If rotation_order is not 'xyz' or 'zyx'.
+        """
+        self._check_index(index)
+        self._local_rotations[index * 9:index * 9 + 9] = array("d", _rotation_values(rotation, rotation_order))
+        self._mark_dirty(index)
+
+    def set_local_matrix(self, index: int, matrix3: Matrix3) -> None:
+        """Set the local rotation of a node from a Matrix3.
+
+        Args:
+            index: node to set.
+            matrix3: local rotation matrix.
+
+        Raises:
+            IndexError: If index is not a node of this hierarchy.
+        """
+        self._check_index(index)
+        if not Matrix3._type_check(matrix3):
+            raise TypeError(Matrix3._ERRORS[0])
+        self._local_rotations[index * 9:index * 9 + 9] = array("d", matrix3.as_list())
+        self._mark_dirty(index)
+
+    def set_local_translation(self, index: int, translation: Vector3) -> None:
+        """Set the local translation of a node.
+
+        Args:
+            index: node to set.
+            translation: local translation.
+
+        Raises:
+            IndexError: If index is not a node of this hierarchy.
+            Vector3ArgumentError: If translation is not a Vector3.
+        """
+        self._check_index(index)
+        if not isinstance(translation, Vector3):
+            raise Vector3ArgumentError(invalid_type=type(translation))
+        self._local_translations[index * 3:index * 3 + 3] = array("d", translation.as_tuple())
+        self._mark_dirty(index)
+
+    def local_matrix(self, index: int) -> Matrix3:
+        """Return the local rotation of a node."""
+        self._check_index(index)
+        return Matrix3(*self._local_rotations[index * 9:index * 9 + 9])
+
+    def local_translation(self, index: int) -> Vector3:
+        """Return the local translation of a node."""
+        self._check_index(index)
+        return Vector3(*self._local_translations[index * 3:index * 3 + 3])
+
+    def world_matrix(self, index: int) -> Matrix3:
+        """Return the world rotation of a node, updating the hierarchy first if anything is dirty."""
+        self._check_index(index)
+        if self._pending:
+            self.update()
+        return Matrix3(*self._world_rotations[index * 9:index * 9 + 9])
+
+    def world_translation(self, index: int) -> Vector3:
+        """Return the world translation of a node, updating the hierarchy first if anything is dirty."""
+        self._check_index(index)
+        if self._pending:
+            self.update()
+        return Vector3(*self._world_translations[index * 3:index * 3 + 3])
+
+    def is_dirty(self, index: int) -> bool:
+        """Return True if the cached world transform of a node is out of date.
+
+        Note:
+            Only nodes that were changed directly are flagged before an update,
+            their descendants are discovered when the update runs.
+        """
+        self._check_index(index)
+        node = index
+        while node != -1:
+            if self._dirty[node]:
+                return True
+            node = self._parents[node]
+        return False
+
+    def update(self) -> int:
+        """Recompute the world transforms of every dirty subtree and return how many nodes were updated.
+
+        Note:
+            Dirty nodes and their descendants are bucketed by depth, then each level is
+            evaluated in turn so a node's parent world transform is always current.
+        """
+        if not self._pending:
+            return 0
+
+        dirty = self._dirty
+        children = self._children
+        depths = self._depths
+        levels: dict[int, list[int]] = {}
+        stack = self._pending
+        self._pending = []
+        for node in stack:
+            levels.setdefault(depths[node], []).append(node)
+        while stack:
+            node = stack.pop()
+            for child in children[node]:
+                if not dirty[child]:
+                    dirty[child] = 1
+                    levels.setdefault(depths[child], []).append(child)
+                    stack.append(child)
+
+        parents = self._parents
+        lr = self._local_rotations
+        lt = self._local_translations
+        wr = self._world_rotations
+        wt = self._world_translations
+        count = 0
+        for depth in sorted(levels):
+            for node in levels[depth]:
+                r = node * 9
+                t = node * 3
+                parent = parents[node]
+                if parent == -1:
+                    wr[r:r + 9] = lr[r:r + 9]
+                    wt[t:t + 3] = lt[t:t + 3]
+                else:
+                    pr = parent * 9
+                    pt = parent * 3
+                    p0, p1, p2, p3, p4, p5, p6, p7, p8 = wr[pr:pr + 9]
+                    l0, l1, l2, l3, l4, l5, l6, l7, l8 = lr[r:r + 9]
+                    x, y, z = lt[t:t + 3]
+                    wr[r] = p0 * l0 + p1 * l3 + p2 * l6
+                    wr[r + 1] = p0 * l1 + p1 * l4 + p2 * l7
+                    wr[r + 2] = p0 * l2 + p1 * l5 + p2 * l8
+                    wr[r + 3] = p3 * l0 + p4 * l3 + p5 * l6
+                    wr[r + 4] = p3 * l1 + p4 * l4 + p5 * l7
+                    wr[r + 5] = p3 * l2 + p4 * l5 + p5 * l8
+                    wr[r + 6] = p6 * l0 + p7 * l3 + p8 * l6
+                    wr[r + 7] = p6 * l1 + p7 * l4 + p8 * l7
+                    wr[r + 8] = p6 * l2 + p7 * l5 + p8 * l8
+                    wt[t] = p0 * x + p1 * y + p2 * z + wt[pt]
+                    wt[t + 1] = p3 * x + p4 * y + p5 * z + wt[pt + 1]
+                    wt[t + 2] = p6 * x + p7 * y + p8 * z + wt[pt + 2]
+                dirty[node] = 0
+                count += 1
+        return count
+
+    def _check_index(self, index: int) -> None:
+        """Raise IndexError if index is not a node of this hierarchy."""
+        if not 0 <= index < len(self._parents):
+            raise IndexError(f"node {index} is not a node of this hierarchy.")
+
+    def _mark_dirty(self, index: int) -> None:
+        """Flag a node as changed so it is picked up by the next update."""
+        if not self._dirty[index]:
+            self._dirty[index] = 1
+            self._pending.append(index)
+
+
+def _rotation_values(rotation: tuple | list, rotation_order: str) -> tuple[float, ...]:
+    """Return the flat row major rotation matrix of XYZ rotation in degrees."""
+    if rotation_order not in _ROTATION_ORDERS:
+        raise ValueError(f"rotation_order must be one of {_ROTATION_ORDERS}. Got: {rotation_order}")
+    rows = Matrix3(1.0).rotation_matrix(rotation, rotation_order=rotation_order)
+    return (*rows[0], *rows[1], *rows[2])
@@ -314,11 +314,11 @@ class Matrix3(object):
             index_5 = -cos(z) * sin(x) + cos(x) * sin(y) * sin(z)
 
             index_6 = -sin(y)
-            index_7 = -cos(y) * sin(x)
+            index_7 = cos(y) * sin(x)
             index_8 = cos(x) * cos(y)
         elif rotation_order == 'xyz':
             index_0 = cos(y) * cos(z)
-            index_1 = -cos(z) * sin(z)
+            index_1 = -cos(y) * sin(z)
             index_2 = sin(y)
 
             index_3 = cos(x) * sin(z) + sin(x) * sin(y) * cos(z)
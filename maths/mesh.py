@@ -0,0 +1,327 @@
+"""Indexed triangle mesh attribute functions."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from math import atan2, pi, sqrt
+
+_WEIGHTINGS = ("area", "angle", "uniform")
+
+
+def face_normals(vertices: Sequence[float], indices: Sequence[int]) -> array:
+    """Return the unit normal of every triangle.
+
+    Args:
+        vertices: flat x, y, z float per vertex.
+        indices: flat three vertex indices per triangle, counter clockwise winding.
+
+    Returns:
+        array: flat x, y, z float per triangle, degenerate triangles get a zero normal.
+    """
+    _check_mesh(vertices, indices)
+    face_count = len(indices) // 3
+    normals = array("d", bytes(24 * face_count))
+    weights = array("d", bytes(24 * face_count))
+    for face in range(face_count):
+        _compute_face(vertices, indices, face, "uniform", normals, weights)
+    return normals
+
+
+def vertex_normals(vertices: Sequence[float], indices: Sequence[int], weighting: str = "area") -> array:
+    """Return the unit normal of every vertex from the triangles that use it.
+
+    Args:
+        vertices: flat x, y, z float per vertex.
+        indices: flat three vertex indices per triangle, counter clockwise winding.
+        weighting: how each triangle contributes to its vertices,
+                   'area' by triangle area, 'angle' by the corner angle at the vertex
+                   or 'uniform' for an equal share.
+
+    Returns:
+        array: flat x, y, z float per vertex, unused vertices get a zero normal.
+
+    Note:
+        Every triangle is visited once and scatter-adds its weighted normal onto its three
+        vertices, the sums are then normalized in a single pass.
+    """
+    _check_mesh(vertices, indices, weighting)
+    face_count = len(indices) // 3
+    normals = array("d", bytes(24 * face_count))
+    weights = array("d", bytes(24 * face_count))
+    sums = array("d", bytes(8 * len(vertices)))
+    for face in range(face_count):
+        _compute_face(vertices, indices, face, weighting, normals, weights)
+        nx, ny, nz = normals[face * 3:face * 3 + 3]
+        for corner in range(face * 3, face * 3 + 3):
+            weight = weights[corner]
+            v = indices[corner] * 3
+            sums[v] += nx * weight
+            sums[v + 1] += ny * weight
+            sums[v + 2] += nz * weight
+    _normalize_flat(sums, range(len(vertices) // 3))
+    return sums
+
+
+def vertex_tangents(vertices: Sequence[float],
+                    normals: Sequence[float],
+                    uvs: Sequence[float],
+                    indices: Sequence[int]) -> array:
+    """Return a tangent frame for every vertex from its texture coordinates.
+
+    Args:
+        vertices: flat x, y, z float per vertex.
+        normals: flat x, y, z unit normal per vertex, see vertex_normals.
+        uvs: flat u, v float per vertex.
+        indices: flat three vertex indices per triangle.
+
+    Returns:
+        array: flat x, y, z, w float per vertex. xyz is the unit tangent orthogonalized
+               against the normal and w is the bitangent handedness, 1.0 or -1.0.
+               The bitangent is cross(normal, tangent) * w.
+
+    Note:
+        Per triangle u and v directions are scatter-added onto each vertex, then the
+        tangent is Gram-Schmidt orthogonalized against the vertex normal.
+    """
+    _check_mesh(vertices, indices)
+    vertex_count = len(vertices) // 3
+    if len(normals) != len(vertices) or len(uvs) != vertex_count * 2:
+        raise ValueError("normals and uvs must have one entry per vertex.")
+    u_sums = array("d", bytes(8 * len(vertices)))
+    v_sums = array("d", bytes(8 * len(vertices)))
+    for face in range(len(indices) // 3):
+        i0, i1, i2 = indices[face * 3:face * 3 + 3]
+        x0, y0, z0 = vertices[i0 * 3:i0 * 3 + 3]
+        e1x, e1y, e1z = vertices[i1 * 3] - x0, vertices[i1 * 3 + 1] - y0, vertices[i1 * 3 + 2] - z0
+        e2x, e2y, e2z = vertices[i2 * 3] - x0, vertices[i2 * 3 + 1] - y0, vertices[i2 * 3 + 2] - z0
+        du1, dv1 = uvs[i1 * 2] - uvs[i0 * 2], uvs[i1 * 2 + 1] - uvs[i0 * 2 + 1]
+        du2, dv2 = uvs[i2 * 2] - uvs[i0 * 2], uvs[i2 * 2 + 1] - uvs[i0 * 2 + 1]
+        determinant = du1 * dv2 - du2 * dv1
+        if determinant == 0.0:
+            continue
+        r = 1.0 / determinant
+        sx, sy, sz = (e1x * dv2 - e2x * dv1) * r, (e1y * dv2 - e2y * dv1) * r, (e1z * dv2 - e2z * dv1) * r
+        tx, ty, tz = (e2x * du1 - e1x * du2) * r, (e2y * du1 - e1y * du2) * r, (e2z * du1 - e1z * du2) * r
+        for i in (i0, i1, i2):
+            v = i * 3
+            u_sums[v] += sx
+            u_sums[v + 1] += sy
+            u_sums[v + 2] += sz
+            v_sums[v] += tx
+            v_sums[v + 1] += ty
+            v_sums[v + 2] += tz
+
+    tangents = array("d", bytes(32 * vertex_count))
+    for i in range(vertex_count):
+        v = i * 3
+        nx, ny, nz = normals[v:v + 3]
+        sx, sy, sz = u_sums[v:v + 3]
+        d = nx * sx + ny * sy + nz * sz
+        tx, ty, tz = sx - nx * d, sy - ny * d, sz - nz * d
+        length = sqrt(tx * tx + ty * ty + tz * tz)
+        if length == 0.0:
+            continue
+        tx, ty, tz = tx / length, ty / length, tz / length
+        bx, by, bz = ny * tz - nz * ty, nz * tx - nx * tz, nx * ty - ny * tx
+        handedness = -1.0 if bx * v_sums[v] + by * v_sums[v + 1] + bz * v_sums[v + 2] < 0.0 else 1.0
+        tangents[i * 4:i * 4 + 4] = array("d", (tx, ty, tz, handedness))
+    return tangents
+
+
+class MeshNormals(object):
+    """Provides vertex normals of an indexed triangle mesh that can be updated incrementally.
+
+    Notes:
+        - Face normals and per corner weights are cached alongside a vertex to corner adjacency table.
+        - move_vertices() only recomputes the faces touching the moved vertices and the normals
+          of the vertices of those faces, every other normal is left untouched.
+
+    """
+    __slots__ = ("_vertices", "_indices", "_weighting",
+                 "_face_normals", "_corner_weights", "_normals",
+                 "_corner_offsets", "_corners")
+
+    def __init__(self, vertices: Sequence[float], indices: Sequence[int], weighting: str = "area"):
+        """Initialization of MeshNormals class.
+
+        Args:
+            vertices: flat x, y, z float per vertex, copied.
+            indices: flat three vertex indices per triangle, counter clockwise winding.
+            weighting: 'area', 'angle' or 'uniform', see vertex_normals.
+        """
+        _check_mesh(vertices, indices, weighting)
+        self._vertices = array("d", vertices)
+        self._indices = array("l", indices)
+        self._weighting = weighting
+        face_count = len(indices) // 3
+        vertex_count = len(vertices) // 3
+        self._face_normals = array("d", bytes(24 * face_count))
+        self._corner_weights = array("d", bytes(24 * face_count))
+        self._normals = array("d", bytes(24 * vertex_count))
+
+        # vertex to corner adjacency, corners of vertex i are _corners[_corner_offsets[i]:_corner_offsets[i + 1]]
+        offsets = array("l", bytes(array("l").itemsize * (vertex_count + 1)))
+        for i in self._indices:
+            offsets[i + 1] += 1
+        for i in range(vertex_count):
+            offsets[i + 1] += offsets[i]
+        fill = array("l", offsets)
+        corners = array("l", bytes(array("l").itemsize * len(self._indices)))
+        for corner, i in enumerate(self._indices):
+            corners[fill[i]] = corner
+            fill[i] += 1
+        self._corner_offsets = offsets
+        self._corners = corners
+
+        self._update_faces(range(face_count))
+        sums = self._normals
+        face_normals = self._face_normals
+        weights = self._corner_weights
+        for corner, i in enumerate(self._indices):
+            f = (corner // 3) * 3
+            weight = weights[corner]
+            v = i * 3
+            sums[v] += face_normals[f] * weight
+            sums[v + 1] += face_normals[f + 1] * weight
+            sums[v + 2] += face_normals[f + 2] * weight
+        _normalize_flat(sums, range(vertex_count))
+
+    def __repr__(self) -> str:
+        return f"MeshNormals: [{len(self._vertices) // 3} vertices, {len(self._indices) // 3} faces]"
+
+    @property
+    def vertices(self) -> array:
+        """array: flat x, y, z float per vertex."""
+        return self._vertices
+
+    @property
+    def normals(self) -> array:
+        """array: flat x, y, z unit normal per vertex."""
+        return self._normals
+
+    @property
+    def face_normals(self) -> array:
+        """array: flat x, y, z unit normal per triangle."""
+        return self._face_normals
+
+    def move_vertices(self, moved: Sequence[int], positions: Sequence[float]) -> list[int]:
+        """Move vertices and update only the normals they affect.
+
+        Args:
+            moved: indices of the vertices to move.
+            positions: flat x, y, z float per moved vertex.
+
+        Returns:
+            list: indices of the vertices whose normals were recomputed.
+
+        Raises:
+            ValueError: If positions does not hold three floats per moved vertex.
+            IndexError: If any moved index is not a vertex of the mesh, nothing is moved.
+        """
+        if len(positions) != len(moved) * 3:
+            raise ValueError("positions must have three floats per moved vertex.")
+        vertex_count = len(self._vertices) // 3
+        for i in moved:
+            if not 0 <= i < vertex_count:
+                raise IndexError(f"vertex {i} is not a vertex of this mesh.")
+        vertices = self._vertices
+        for k, i in enumerate(moved):
+            vertices[i * 3] = positions[k * 3]
+            vertices[i * 3 + 1] = positions[k * 3 + 1]
+            vertices[i * 3 + 2] = positions[k * 3 + 2]
+
+        offsets = self._corner_offsets
+        corners = self._corners
+        faces = {corners[c] // 3 for i in moved for c in range(offsets[i], offsets[i + 1])}
+        self._update_faces(faces)
+
+        indices = self._indices
+        affected = sorted({indices[f * 3 + k] for f in faces for k in range(3)})
+        self._gather_normals(affected)
+        return affected
+
+    def _update_faces(self, faces: Iterable[int]) -> None:
+        """Recompute the cached normal and corner weights of faces."""
+        for face in faces:
+            _compute_face(self._vertices, self._indices, face, self._weighting,
+                          self._face_normals, self._corner_weights)
+
+    def _gather_normals(self, vertices: Iterable[int]) -> None:
+        """Recompute vertex normals by summing the weighted normals of their corners."""
+        offsets = self._corner_offsets
+        corners = self._corners
+        face_normals = self._face_normals
+        weights = self._corner_weights
+        normals = self._normals
+        for i in vertices:
+            x = y = z = 0.0
+            for c in range(offsets[i], offsets[i + 1]):
+                corner = corners[c]
+                f = (corner // 3) * 3
+                weight = weights[corner]
+                x += face_normals[f] * weight
+                y += face_normals[f + 1] * weight
+                z += face_normals[f + 2] * weight
+            length = sqrt(x * x + y * y + z * z)
+            if length > 0.0:
+                x, y, z = x / length, y / length, z / length
+            normals[i * 3:i * 3 + 3] = array("d", (x, y, z))
+
+
+def _check_mesh(vertices: Sequence[float], indices: Sequence[int], weighting: str = "area") -> None:
+    """Validate flat vertex and index arrays, every index must refer to an existing vertex."""
+    if len(vertices) % 3:
+        raise ValueError("vertices must contain three floats per vertex.")
+    if len(indices) % 3:
+        raise ValueError("indices must contain three indices per triangle.")
+    if indices and not 0 <= min(indices) <= max(indices) < len(vertices) // 3:
+        raise IndexError(f"indices must be in range 0 to {len(vertices) // 3 - 1}. "
+                         f"Got: {min(indices)} to {max(indices)}")
+    if weighting not in _WEIGHTINGS:
+        raise ValueError(f"weighting must be one of {_WEIGHTINGS}. Got: {weighting}")
+
+
+def _compute_face(vertices: Sequence[float],
+                  indices: Sequence[int],
+                  face: int,
+                  weighting: str,
+                  normals: array,
+                  weights: array) -> None:
+    """Write the unit normal of face into normals and the weight of its three corners into weights."""
+    f = face * 3
+    i0, i1, i2 = indices[f:f + 3]
+    x0, y0, z0 = vertices[i0 * 3:i0 * 3 + 3]
+    x1, y1, z1 = vertices[i1 * 3:i1 * 3 + 3]
+    x2, y2, z2 = vertices[i2 * 3:i2 * 3 + 3]
+    ax, ay, az = x1 - x0, y1 - y0, z1 - z0
+    bx, by, bz = x2 - x0, y2 - y0, z2 - z0
+    nx, ny, nz = ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx
+    length = sqrt(nx * nx + ny * ny + nz * nz)
+    if length == 0.0:
+        normals[f:f + 3] = array("d", (0.0, 0.0, 0.0))
+        weights[f:f + 3] = array("d", (0.0, 0.0, 0.0))
+        return
+    normals[f:f + 3] = array("d", (nx / length, ny / length, nz / length))
+    if weighting == "area":
+        area = length * 0.5
+        weights[f:f + 3] = array("d", (area, area, area))
+    elif weighting == "angle":
+        cx, cy, cz = x2 - x1, y2 - y1, z2 - z1
+        # corner angle = atan2(|e1 x e2|, e1 . e2), |e1 x e2| is twice the area for every corner.
+        a0 = atan2(length, ax * bx + ay * by + az * bz)
+        a1 = atan2(length, -(ax * cx + ay * cy + az * cz))
+        weights[f:f + 3] = array("d", (a0, a1, pi - a0 - a1))
+    else:
+        weights[f:f + 3] = array("d", (1.0, 1.0, 1.0))
+
+
+def _normalize_flat(values: array, items: Iterable[int]) -> None:
+    """Normalize the x, y, z triples of items in place, zero length triples are left as is."""
+    for i in items:
+        v = i * 3
+        x, y, z = values[v:v + 3]
+        length = sqrt(x * x + y * y + z * z)
+        if length > 0.0:
+            values[v] = x / length
+            values[v + 1] = y / length
+            values[v + 2] = z / length
@@ -0,0 +1,130 @@
+"""Batch re-orthonormalization of rotation matrices."""
+from __future__ import annotations
+
+from collections.abc import MutableSequence, Sequence
+from math import sqrt
+
+from .decomposition import _perpendicular, _polar_rotation
+from .matrix3 import Matrix3
+
+_MODES = ("gram_schmidt", "polar")
+# rows whose length drops to this or below count as zero, see _gram_schmidt.
+_EPSILON = 1e-9
+
+
+def orthogonality_error(matrix3: Matrix3) -> float:
+    """Return how far a Matrix3 is from orthonormal.
+
+    Note:
+        The error is the Frobenius norm of matrix3 * transpose(matrix3) - identity.
+    """
+    if not Matrix3._type_check(matrix3):
+        raise TypeError(Matrix3._ERRORS[0])
+    return sqrt(_squared_error(*matrix3.as_list()))
+
+
+def orthonormalize(matrices: Sequence[Matrix3], mode: str = "gram_schmidt", tolerance: float = 0.0) -> int:
+    """Repair drifted rotation Matrix3s in place.
+
+    Args:
+        matrices: Matrix3 objects to repair.
+        mode: 'gram_schmidt' to normalize row 1, orthogonalize row 2 against it and rebuild
+              row 3 as their cross product, or 'polar' for the closest rotation, which spreads
+              the correction evenly across all rows.
+        tolerance: matrices whose orthogonality_error is at or below this are left untouched.
+
+    Returns:
+        int: number of matrices that were repaired.
+    """
+    repair = _repair_function(mode)
+    tolerance_squared = tolerance * tolerance
+    count = 0
+    for matrix3 in matrices:
+        if not Matrix3._type_check(matrix3):
+            raise TypeError(Matrix3._ERRORS[0])
+        r1, r2, r3 = matrix3.as_list_of_lists()
+        values = (*r1, *r2, *r3)
+        if _squared_error(*values) <= tolerance_squared:
+            continue
+        r1[0], r1[1], r1[2], r2[0], r2[1], r2[2], r3[0], r3[1], r3[2] = repair(values)
+        count += 1
+    return count
+
+
+def orthonormalize_flat(values: MutableSequence[float], mode: str = "gram_schmidt", tolerance: float = 0.0) -> int:
+    """Repair drifted rotations stored as flat row major floats in place.
+
+    Args:
+        values: mutable flat sequence with nine floats per matrix, e.g. array('d').
+        mode: 'gram_schmidt' or 'polar', see orthonormalize.
+        tolerance: matrices whose orthogonality error is at or below this are left untouched.
+
+    Returns:
+        int: number of matrices that were repaired.
+    """
+    if len(values) % 9:
+        raise ValueError("values must contain nine floats per matrix.")
+    repair = _repair_function(mode)
+    tolerance_squared = tolerance * tolerance
+    count = 0
+    for i in range(0, len(values), 9):
+        m = values[i:i + 9]
+        if _squared_error(*m) <= tolerance_squared:
+            continue
+        for k, value in enumerate(repair(m)):
+            values[i + k] = value
+        count += 1
+    return count
+
+
+def _repair_function(mode: str):
+    """Return the repair function of mode."""
+    if mode not in _MODES:
+        raise ValueError(f"mode must be one of {_MODES}. Got: {mode}")
+    return _gram_schmidt if mode == "gram_schmidt" else _polar_rotation
+
+
+def _squared_error(m0: float, m1: float, m2: float,
+                   m3: float, m4: float, m5: float,
+                   m6: float, m7: float, m8: float) -> float:
+    """Return the squared Frobenius norm of m * transpose(m) - identity."""
+    d1 = m0 * m0 + m1 * m1 + m2 * m2 - 1.0
+    d2 = m3 * m3 + m4 * m4 + m5 * m5 - 1.0
+    d3 = m6 * m6 + m7 * m7 + m8 * m8 - 1.0
+    o12 = m0 * m3 + m1 * m4 + m2 * m5
+    o13 = m0 * m6 + m1 * m7 + m2 * m8
+    o23 = m3 * m6 + m4 * m7 + m5 * m8
+    return d1 * d1 + d2 * d2 + d3 * d3 + 2.0 * (o12 * o12 + o13 * o13 + o23 * o23)
+
+
+def _gram_schmidt(m: Sequence[float]) -> tuple[float, ...]:
+    """Return the Gram-Schmidt orthonormalized rows of a flat row major matrix.
+
+    Note:
+        A zero first row is replaced by the cross product of rows 2 and 3, and a second row
+        that is zero or collinear with the first is rebuilt from the third row, so degenerate
+        input still gives a proper rotation like the polar mode does.
+    """
+    ax, ay, az, bx, by, bz, cx, cy, cz = m
+    length = sqrt(ax * ax + ay * ay + az * az)
+    if length <= _EPSILON:
+        ax, ay, az = by * cz - bz * cy, bz * cx - bx * cz, bx * cy - by * cx
+        length = sqrt(ax * ax + ay * ay + az * az)
+    if length <= _EPSILON:
+        ax, ay, az, length = 1.0, 0.0, 0.0, 1.0
+    ax, ay, az = ax / length, ay / length, az / length
+    b_length = sqrt(bx * bx + by * by + bz * bz)
+    d = ax * bx + ay * by + az * bz
+    bx, by, bz = bx - d * ax, by - d * ay, bz - d * az
+    length = sqrt(bx * bx + by * by + bz * bz)
+    if length <= _EPSILON * max(b_length, 1.0):
+        # row 2 = row 3 x row 1 for a right handed frame.
+        bx, by, bz = cy * az - cz * ay, cz * ax - cx * az, cx * ay - cy * ax
+        length = sqrt(bx * bx + by * by + bz * bz)
+        if length <= _EPSILON * max(sqrt(cx * cx + cy * cy + cz * cz), 1.0):
+            bx, by, bz = _perpendicular((ax, ay, az))
+            length = 1.0
+    bx, by, bz = bx / length, by / length, bz / length
+    return (ax, ay, az,
+            bx, by, bz,
+            ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx)
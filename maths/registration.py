@@ -0,0 +1,215 @@
+"""Rigid point set registration."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from math import sqrt
+
+from .decomposition import _svd
+from .matrix3 import Matrix3
+from .vector3 import Vector3
+
+
+class Registration(object):
+    """Provides the result of a rigid registration.
+
+    Notes:
+        - target ~= rotation * source + translation
+        - rmsd is the root mean square distance between the aligned source and the target.
+
+    """
+    __slots__ = ("rotation", "translation", "rmsd")
+
+    def __init__(self, rotation: Matrix3, translation: Vector3, rmsd: float):
+        """Initialization of Registration class.
+
+        Args:
+            rotation: rotation taking source onto target.
+            translation: translation applied after the rotation.
+            rmsd: root mean square distance after alignment.
+        """
+        self.rotation = rotation
+        self.translation = translation
+        self.rmsd = rmsd
+
+    def __repr__(self) -> str:
+        return f"Registration: [{self.rotation}, {self.translation}, rmsd {self.rmsd}]"
+
+
+class CrossCovariance(object):
+    """Provides a running accumulation of corresponding point sets for Kabsch registration.
+
+    Notes:
+        - Each chunk is centered on its own means before its cross-covariance and second moments
+          are summed, then folded into the running totals with the parallel (Chan) update.
+          Large coordinate offsets therefore never enter the products, so precision does not
+          depend on how far the points sit from the origin.
+        - Correspondences can be added in chunks of any size and accumulators of different
+          chunks can be merged.
+        - solve() takes the signed SVD of the 3x3 cross-covariance, reflections are handled
+          by the sign of the smallest singular value.
+
+    """
+    __slots__ = ("_count", "_source_mean", "_target_mean", "_source_moment", "_target_moment", "_covariance")
+
+    def __init__(self):
+        """Initialization of CrossCovariance class."""
+        self._count = 0
+        self._source_mean = [0.0, 0.0, 0.0]
+        self._target_mean = [0.0, 0.0, 0.0]
+        # sum(|p - mean(p)|^2) and sum(|q - mean(q)|^2)
+        self._source_moment = 0.0
+        self._target_moment = 0.0
+        # sum((p - mean(p)) * (q - mean(q))^T), flat row major
+        self._covariance = [0.0] * 9
+
+    def __repr__(self) -> str:
+        return f"CrossCovariance: [{self._count} points]"
+
+    def __len__(self) -> int:
+        """Return the number of accumulated correspondences."""
+        return self._count
+
+    def add(self, source: Sequence[float], target: Sequence[float]) -> None:
+        """Accumulate corresponding points.
+
+        Args:
+            source: flat x, y, z float per point.
+            target: flat x, y, z float per point, matching source.
+
+        Raises:
+            ValueError: If source and target do not contain the same number of points.
+        """
+        if len(source) != len(target) or len(source) % 3:
+            raise ValueError("source and target must contain three floats per corresponding point.")
+        count = len(source) // 3
+        if count == 0:
+            return
+        px = sum(source[0::3]) / count
+        py = sum(source[1::3]) / count
+        pz = sum(source[2::3]) / count
+        qx = sum(target[0::3]) / count
+        qy = sum(target[1::3]) / count
+        qz = sum(target[2::3]) / count
+        source_moment = target_moment = 0.0
+        h0 = h1 = h2 = h3 = h4 = h5 = h6 = h7 = h8 = 0.0
+        for i in range(0, len(source), 3):
+            ax, ay, az = source[i] - px, source[i + 1] - py, source[i + 2] - pz
+            bx, by, bz = target[i] - qx, target[i + 1] - qy, target[i + 2] - qz
+            source_moment += ax * ax + ay * ay + az * az
+            target_moment += bx * bx + by * by + bz * bz
+            h0 += ax * bx
+            h1 += ax * by
+            h2 += ax * bz
+            h3 += ay * bx
+            h4 += ay * by
+            h5 += ay * bz
+            h6 += az * bx
+            h7 += az * by
+            h8 += az * bz
+        self._combine(count, (px, py, pz), (qx, qy, qz),
+                      source_moment, target_moment, (h0, h1, h2, h3, h4, h5, h6, h7, h8))
+
+    def merge(self, other: CrossCovariance) -> CrossCovariance:
+        """Add the correspondences accumulated by another CrossCovariance to this one and return self."""
+        if not isinstance(other, CrossCovariance):
+            raise TypeError(f"argument must be of type CrossCovariance. Got: {type(other)}")
+        if other._count:
+            self._combine(other._count, other._source_mean, other._target_mean,
+                          other._source_moment, other._target_moment, other._covariance)
+        return self
+
+    def solve(self) -> Registration:
+        """Return the rotation and translation that best align the accumulated source onto target.
+
+        Note:
+            rmsd is derived from the accumulated moments, so for a perfect fit it can read up to
+            around 1e-8 times the spread of the points rather than exactly zero.
+
+        Raises:
+            ValueError: If no points have been accumulated.
+        """
+        n = self._count
+        if n == 0:
+            raise ValueError("no correspondences have been added.")
+        px, py, pz = self._source_mean
+        qx, qy, qz = self._target_mean
+        u, s, v = _svd(self._covariance)
+        # R = V * transpose(U)
+        r = [v[row * 3] * u[column * 3] + v[row * 3 + 1] * u[column * 3 + 1] + v[row * 3 + 2] * u[column * 3 + 2]
+             for row in range(3) for column in range(3)]
+        translation = Vector3(qx - (r[0] * px + r[1] * py + r[2] * pz),
+                              qy - (r[3] * px + r[4] * py + r[5] * pz),
+                              qz - (r[6] * px + r[7] * py + r[8] * pz))
+        error = self._source_moment + self._target_moment - 2.0 * (s[0] + s[1] + s[2])
+        return Registration(Matrix3(*r), translation, sqrt(max(error, 0.0) / n))
+
+    def _combine(self,
+                 count: int,
+                 source_mean: Sequence[float],
+                 target_mean: Sequence[float],
+                 source_moment: float,
+                 target_moment: float,
+                 covariance: Sequence[float]) -> None:
+        """Fold centered statistics of another set of correspondences into the running totals.
+
+        Note:
+            Chan et al. parallel update, with d = mean_b - mean_a and n = n_a + n_b:
+            C = C_a + C_b + d_p * d_q^T * n_a * n_b / n
+            M = M_a + M_b + |d|^2 * n_a * n_b / n
+            mean = mean_a + d * n_b / n
+        """
+        n_a = self._count
+        n = n_a + count
+        weight = n_a * count / n
+        dp = [b - a for a, b in zip(self._source_mean, source_mean)]
+        dq = [b - a for a, b in zip(self._target_mean, target_mean)]
+        self._covariance = [self._covariance[row * 3 + column] + covariance[row * 3 + column]
+                            + dp[row] * dq[column] * weight
+                            for row in range(3) for column in range(3)]
+        self._source_moment += source_moment + (dp[0] * dp[0] + dp[1] * dp[1] + dp[2] * dp[2]) * weight
+        self._target_moment += target_moment + (dq[0] * dq[0] + dq[1] * dq[1] + dq[2] * dq[2]) * weight
+        self._source_mean = [a + d * count / n for a, d in zip(self._source_mean, dp)]
+        self._target_mean = [a + d * count / n for a, d in zip(self._target_mean, dq)]
+        self._count = n
+
+
+def register(source: Sequence[float], target: Sequence[float]) -> Registration:
+    """Find the rigid transform that best aligns source onto target.
+
+    Args:
+        source: flat x, y, z float per point.
+        target: flat x, y, z float per point, matching source.
+
+    Returns:
+        Registration: rotation, translation and rmsd with target ~= rotation * source + translation.
+
+    Note:
+        With all points at hand rmsd is measured directly from the aligned residuals,
+        so it reaches zero for a perfect fit, see CrossCovariance.solve.
+    """
+    covariance = CrossCovariance()
+    covariance.add(source, target)
+    result = covariance.solve()
+    r = result.rotation.as_list()
+    tx, ty, tz = result.translation.as_tuple()
+    error = 0.0
+    for i in range(0, len(source), 3):
+        px, py, pz = source[i], source[i + 1], source[i + 2]
+        dx = r[0] * px + r[1] * py + r[2] * pz + tx - target[i]
+        dy = r[3] * px + r[4] * py + r[5] * pz + ty - target[i + 1]
+        dz = r[6] * px + r[7] * py + r[8] * pz + tz - target[i + 2]
+        error += dx * dx + dy * dy + dz * dz
+    result.rmsd = sqrt(error / len(covariance))
+    return result
+
+
+def register_many(pairs: Iterable[tuple[Sequence[float], Sequence[float]]]) -> list[Registration]:
+    """Register many independent correspondence sets.
+
+    Args:
+        pairs: source and target flat point arrays, see register.
+
+    Returns:
+        list: one Registration per pair.
+    """
+    return [register(source, target) for source, target in pairs]
@@ -0,0 +1,362 @@
+"""Keyframe track classes."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from math import acos, sin, sqrt
+
+from .errors import Vector3ArgumentError
+from .matrix3 import Matrix3
+from .vector3 import Vector3
+
+
+class _Track(object):
+    """Shared key time storage and segment lookup for keyframe tracks.
+
+    Notes:
+        - Segment i spans times[i] to times[i + 1], each segment stores its precomputed
+          coefficients back to back in one flat array.
+        - A track with a single key is stored as one zero length segment.
+        - Sample times outside the keyed range are clamped to the first or last key.
+        - Subclasses define _evaluate(out, offset, segment, u) to write the value of
+          segment at u into out starting at offset.
+
+    """
+    __slots__ = ("_times", "_inverse_durations", "_coefficients", "_cursor")
+    _OUTPUT_SIZE = 0
+
+    def _init_times(self, times: Sequence[float], count: int) -> None:
+        """Validate key times and store them with per segment inverse durations."""
+        if len(times) != count:
+            raise ValueError(f"expected {count} key times, got {len(times)}.")
+        if count == 0:
+            raise ValueError("a track needs at least one key.")
+        self._times = array("d", times)
+        if count == 1:
+            self._times.append(self._times[0])
+        self._inverse_durations = array("d")
+        for i in range(len(self._times) - 1):
+            duration = self._times[i + 1] - self._times[i]
+            if duration <= 0.0 and count > 1:
+                raise ValueError("key times must be strictly increasing.")
+            self._inverse_durations.append(1.0 / duration if duration > 0.0 else 0.0)
+        self._coefficients = array("d")
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        """Return the number of segments."""
+        return len(self._inverse_durations)
+
+    @property
+    def start(self) -> float:
+        """Time of the first key."""
+        return self._times[0]
+
+    @property
+    def end(self) -> float:
+        """Time of the last key."""
+        return self._times[-1]
+
+    def _locate(self, time: float) -> tuple[int, float]:
+        """Return the segment containing time and the normalized 0-1 position within it.
+
+        Note:
+            The segment found by the previous call and the one after it are checked first
+            so monotonic playback avoids the binary search.
+        """
+        times = self._times
+        last = len(self._inverse_durations) - 1
+        segment = self._cursor
+        if not times[segment] <= time < times[segment + 1]:
+            if segment < last and times[segment + 1] <= time < times[segment + 2]:
+                segment += 1
+            else:
+                segment = min(max(bisect_right(times, time) - 1, 0), last)
+            self._cursor = segment
+        u = (time - times[segment]) * self._inverse_durations[segment]
+        return segment, 0.0 if u < 0.0 else 1.0 if u > 1.0 else u
+
+    def _sample_sorted(self, times: Sequence[float], order: Sequence[int]) -> array:
+        """Sample times visited in ascending order, sweeping segments forward instead of searching."""
+        size = self._OUTPUT_SIZE
+        out = array("d", bytes(8 * size * len(times)))
+        key_times = self._times
+        inverse_durations = self._inverse_durations
+        last = len(inverse_durations) - 1
+        evaluate = self._evaluate
+        segment = 0
+        for i in order:
+            time = times[i]
+            while segment < last and time >= key_times[segment + 1]:
+                segment += 1
+            u = (time - key_times[segment]) * inverse_durations[segment]
+            evaluate(out, i * size, segment, 0.0 if u < 0.0 else 1.0 if u > 1.0 else u)
+        return out
+
+    def sample_many(self, times: Sequence[float]) -> array:
+        """Sample the track at many times at once.
+
+        Args:
+            times: sample times in any order.
+
+        Returns:
+            array: flat float array with one value per sample, in the order of times.
+        """
+        return self._sample_sorted(times, _ascending_order(times))
+
+
+class Vector3Track(_Track):
+    """Provides a keyframe track of Vector3 values with precomputed cubic segments.
+
+    Notes:
+        - interpolation may be 'linear', 'hermite' or 'catmull_rom'.
+        - 'hermite' requires one tangent (value change per unit time) for every key.
+        - 'catmull_rom' derives tangents from neighbouring keys and supports uneven key spacing.
+        - Every segment is stored as a + b*u + c*u^2 + d*u^3 per component,
+          so sampling costs the same for every interpolation.
+
+    """
+    __slots__ = ("_interpolation",)
+    _OUTPUT_SIZE = 3
+    _INTERPOLATIONS = ("linear", "hermite", "catmull_rom")
+
+    def __init__(self,
+                 times: Sequence[float],
+                 values: Sequence[Vector3],
+                 interpolation: str = "linear",
+                 tangents: Sequence[Vector3] = None):
+        """Initialization of Vector3Track class.
+
+        Args:
+            times: strictly increasing key times.
+            values: Vector3 value for each key.
+            interpolation: 'linear', 'hermite' or 'catmull_rom'.
+            tangents: Vector3 tangent for each key, required for 'hermite'.
+
+        Raises:
+            ValueError: If times, values or tangents do not line up or interpolation is unknown.
+            Vector3ArgumentError: If values or tangents are not Vector3.
+        """
+        if interpolation not in self._INTERPOLATIONS:
+            raise ValueError(f"interpolation must be one of {self._INTERPOLATIONS}. Got: {interpolation}")
+        self._init_times(times, len(values))
+        self._interpolation = interpolation
+        points = _flatten_vectors(values)
+
+        if interpolation == "hermite":
+            if tangents is None or len(tangents) != len(values):
+                raise ValueError("hermite interpolation requires one tangent per key.")
+            slopes = _flatten_vectors(tangents)
+        elif interpolation == "catmull_rom":
+            slopes = self._catmull_rom_tangents(points)
+        else:
+            slopes = None
+
+        coefficients = self._coefficients
+        inverse_durations = self._inverse_durations
+        for s in range(len(inverse_durations)):
+            i0 = s * 3
+            i1 = i0 + 3 if len(values) > 1 else i0
+            duration = 1.0 / inverse_durations[s] if inverse_durations[s] else 0.0
+            for axis in range(3):
+                p0 = points[i0 + axis]
+                p1 = points[i1 + axis]
+                if slopes is None:
+                    coefficients.extend((p0, p1 - p0, 0.0, 0.0))
+                else:
+                    m0 = slopes[i0 + axis] * duration
+                    m1 = slopes[i1 + axis] * duration
+                    coefficients.extend((p0,
+                                         m0,
+                                         3.0 * (p1 - p0) - 2.0 * m0 - m1,
+                                         2.0 * (p0 - p1) + m0 + m1))
+
+    def __repr__(self) -> str:
+        return f"Vector3Track: [{len(self)} segments, {self._interpolation}]"
+
+    @property
+    def interpolation(self) -> str:
+        """Interpolation used between keys."""
+        return self._interpolation
+
+    def _catmull_rom_tangents(self, points: array) -> array:
+        """Return per key tangents from the neighbouring keys, one sided at the ends."""
+        times = self._times
+        count = len(points) // 3
+        slopes = array("d", bytes(8 * len(points)))
+        if count < 2:
+            return slopes
+        for k in range(count):
+            before = max(k - 1, 0)
+            after = min(k + 1, count - 1)
+            inverse = 1.0 / (times[after] - times[before])
+            for axis in range(3):
+                slopes[k * 3 + axis] = (points[after * 3 + axis] - points[before * 3 + axis]) * inverse
+        return slopes
+
+    def _evaluate(self, out: array, offset: int, segment: int, u: float) -> None:
+        c = self._coefficients
+        i = segment * 12
+        out[offset] = c[i] + u * (c[i + 1] + u * (c[i + 2] + u * c[i + 3]))
+        out[offset + 1] = c[i + 4] + u * (c[i + 5] + u * (c[i + 6] + u * c[i + 7]))
+        out[offset + 2] = c[i + 8] + u * (c[i + 9] + u * (c[i + 10] + u * c[i + 11]))
+
+    def sample(self, time: float) -> Vector3:
+        """Return the track value at time.
+
+        Args:
+            time: sample time, clamped to the keyed range.
+        """
+        out = array("d", (0.0, 0.0, 0.0))
+        self._evaluate(out, 0, *self._locate(time))
+        return Vector3(out[0], out[1], out[2])
+
+
+class RotationTrack(_Track):
+    """Provides a keyframe track of rotation Matrix3 values interpolated with slerp.
+
+    Notes:
+        - Keys are converted to unit quaternions at build time and neighbouring keys are
+          flipped onto the same hemisphere so every segment takes the shortest arc.
+        - The arc angle and 1 / sin(angle) of every segment are precomputed.
+
+    """
+    __slots__ = ()
+    _OUTPUT_SIZE = 9
+    # below this arc angle slerp falls back to a normalized lerp.
+    _SLERP_EPSILON = 1e-6
+
+    def __init__(self, times: Sequence[float], rotations: Sequence[Matrix3]):
+        """Initialization of RotationTrack class.
+
+        Args:
+            times: strictly increasing key times.
+            rotations: rotation Matrix3 for each key.
+
+        Raises:
+            ValueError: If times and rotations do not line up.
+            TypeError: If rotations are not Matrix3.
+        """
+        self._init_times(times, len(rotations))
+        quaternions = []
+        for rotation in rotations:
+            if not Matrix3._type_check(rotation):
+                raise TypeError(Matrix3._ERRORS[0])
+            q = _matrix_to_quaternion(rotation.as_list())
+            if quaternions and sum(a * b for a, b in zip(q, quaternions[-1])) < 0.0:
+                q = tuple(-a for a in q)
+            quaternions.append(q)
+        if len(quaternions) == 1:
+            quaternions.append(quaternions[0])
+
+        for s in range(len(self._inverse_durations)):
+            q0 = quaternions[s]
+            q1 = quaternions[s + 1]
+            cos_theta = min(sum(a * b for a, b in zip(q0, q1)), 1.0)
+            theta = acos(cos_theta)
+            inverse_sin = 1.0 / sin(theta) if theta > self._SLERP_EPSILON else 0.0
+            self._coefficients.extend((*q0, *q1, theta, inverse_sin))
+
+    def __repr__(self) -> str:
+        return f"RotationTrack: [{len(self)} segments]"
+
+    def _evaluate(self, out: array, offset: int, segment: int, u: float) -> None:
+        c = self._coefficients
+        i = segment * 10
+        theta = c[i + 8]
+        if theta > self._SLERP_EPSILON:
+            inverse_sin = c[i + 9]
+            w0 = sin((1.0 - u) * theta) * inverse_sin
+            w1 = sin(u * theta) * inverse_sin
+        else:
+            w0 = 1.0 - u
+            w1 = u
+        w = w0 * c[i] + w1 * c[i + 4]
+        x = w0 * c[i + 1] + w1 * c[i + 5]
+        y = w0 * c[i + 2] + w1 * c[i + 6]
+        z = w0 * c[i + 3] + w1 * c[i + 7]
+        inverse_length = 1.0 / sqrt(w * w + x * x + y * y + z * z)
+        _quaternion_to_matrix(out, offset,
+                              w * inverse_length, x * inverse_length,
+                              y * inverse_length, z * inverse_length)
+
+    def sample(self, time: float) -> Matrix3:
+        """Return the track rotation at time.
+
+        Args:
+            time: sample time, clamped to the keyed range.
+        """
+        out = array("d", bytes(72))
+        self._evaluate(out, 0, *self._locate(time))
+        return Matrix3(*out)
+
+
+def sample_tracks(tracks: Sequence[_Track], times: Sequence[float]) -> list[array]:
+    """Sample many tracks at the same times.
+
+    Args:
+        tracks: Vector3Track or RotationTrack objects.
+        times: sample times in any order.
+
+    Returns:
+        list: one flat float array per track, see sample_many.
+
+    Note:
+        The sample times are sorted once and every track sweeps them in a single pass.
+    """
+    order = _ascending_order(times)
+    return [track._sample_sorted(times, order) for track in tracks]
+
+
+def _ascending_order(times: Sequence[float]) -> Sequence[int]:
+    """Return the indices of times in ascending time order."""
+    if all(times[i] <= times[i + 1] for i in range(len(times) - 1)):
+        return range(len(times))
+    return sorted(range(len(times)), key=times.__getitem__)
+
+
+def _flatten_vectors(vectors: Sequence[Vector3]) -> array:
+    """Return Vector3 components as a flat float array."""
+    flat = array("d")
+    for vector in vectors:
+        if not isinstance(vector, Vector3):
+            raise Vector3ArgumentError(invalid_type=type(vector))
+        flat.extend(vector.as_tuple())
+    return flat
+
+
+def _matrix_to_quaternion(m: Sequence[float]) -> tuple[float, float, float, float]:
+    """Return the unit w, x, y, z quaternion of a flat row major rotation matrix."""
+    m00, m01, m02, m10, m11, m12, m20, m21, m22 = m
+    trace = m00 + m11 + m22
+    if trace > 0.0:
+        s = sqrt(trace + 1.0) * 2.0
+        q = (0.25 * s, (m21 - m12) / s, (m02 - m20) / s, (m10 - m01) / s)
+    elif m00 > m11 and m00 > m22:
+        s = sqrt(1.0 + m00 - m11 - m22) * 2.0
+        q = ((m21 - m12) / s, 0.25 * s, (m01 + m10) / s, (m02 + m20) / s)
+    elif m11 > m22:
+        s = sqrt(1.0 + m11 - m00 - m22) * 2.0
+        q = ((m02 - m20) / s, (m01 + m10) / s, 0.25 * s, (m12 + m21) / s)
+    else:
+        s = sqrt(1.0 + m22 - m00 - m11) * 2.0
+        q = ((m10 - m01) / s, (m02 + m20) / s, (m12 + m21) / s, 0.25 * s)
+    length = sqrt(sum(a * a for a in q))
+    return q[0] / length, q[1] / length, q[2] / length, q[3] / length
+
+
+def _quaternion_to_matrix(out: array, offset: int, w: float, x: float, y: float, z: float) -> None:
+    """Write the flat row major rotation matrix of a unit quaternion into out starting at offset."""
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+    out[offset] = 1.0 - 2.0 * (yy + zz)
+    out[offset + 1] = 2.0 * (xy - wz)
+    out[offset + 2] = 2.0 * (xz + wy)
+    out[offset + 3] = 2.0 * (xy + wz)
+    out[offset + 4] = 1.0 - 2.0 * (xx + zz)
+    out[offset + 5] = 2.0 * (yz - wx)
+    out[offset + 6] = 2.0 * (xz - wy)
+    out[offset + 7] = 2.0 * (yz + wx)
+    out[offset + 8] = 1.0 - 2.0 * (xx + yy)
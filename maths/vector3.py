@@ -250,6 +250,18 @@ class Vector3(object):
         """
         return self._x * other.x + self._y * other.y + self._z * other.z
 
+    def is_close(self, other: "Vector3", tolerance: float = 1e-9) -> bool:
+        """Return True if the incoming Vector3 is within tolerance distance of this Vector3.
+
+        Args:
+            other: Vector3 to compare against.
+            tolerance: largest distance at which the Vector3s are considered equal.
+        """
+        if not isinstance(other, type(self)):
+            raise Vector3ArgumentError(invalid_type=type(other))
+        dx, dy, dz = self._x - other.x, self._y - other.y, self._z - other.z
+        return dx * dx + dy * dy + dz * dz <= tolerance * tolerance
+
     def normalize(self) -> None:
         """Normalize this Vector3."""
         m = self.magnitude
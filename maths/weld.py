@@ -0,0 +1,122 @@
+"""Tolerance based point welding."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from math import floor
+
+from .errors import NumTypeArgumentError
+
+
+class Welder(object):
+    """Provides streaming deduplication of points that lie within a tolerance of each other.
+
+    Notes:
+        - Unique points are hashed into a grid with cells twice the size of the tolerance, so only the
+          cell of an incoming point and the 7 cells nearest to it need to be searched,
+          keeping welding roughly linear.
+        - The first point seen in a cluster is kept, later points within tolerance of it map onto it.
+          Kept points are never within tolerance of each other, a point near several maps onto the first found.
+        - Chunks can be added one after another, remap indices always refer to the unique points
+          accumulated so far.
+
+    """
+    __slots__ = ("_tolerance", "_inverse_cell", "_tolerance_squared", "_points", "_cells")
+    _ACCEPTED_TYPES = (int, float)
+
+    def __init__(self, tolerance: float | int):
+        """Initialization of Welder class.
+
+        Args:
+            tolerance: points closer than or equal to this distance are merged.
+
+        Raises:
+            NumTypeArgumentError: If tolerance is not a float or int.
+            ValueError: If tolerance is not positive.
+        """
+        if not isinstance(tolerance, self._ACCEPTED_TYPES):
+            raise NumTypeArgumentError(invalid_type=type(tolerance))
+        if tolerance <= 0:
+            raise ValueError(f"tolerance must be positive. Got: {tolerance}")
+        self._tolerance = float(tolerance)
+        self._inverse_cell = 0.5 / self._tolerance
+        self._tolerance_squared = self._tolerance * self._tolerance
+        self._points = array("d")
+        self._cells: dict[tuple[int, int, int], list[int]] = {}
+
+    def __repr__(self) -> str:
+        return f"Welder: [{len(self)} points, tolerance {self._tolerance}]"
+
+    def __len__(self) -> int:
+        """Return the number of unique points."""
+        return len(self._points) // 3
+
+    @property
+    def tolerance(self) -> float:
+        """Distance within which points are merged."""
+        return self._tolerance
+
+    @property
+    def points(self) -> array:
+        """array: flat x, y, z float per unique point."""
+        return self._points
+
+    def add(self, points: Sequence[float]) -> array:
+        """Weld a chunk of points against every unique point added so far.
+
+        Args:
+            points: flat x, y, z float per point.
+
+        Returns:
+            array: index into points of the unique point each incoming point maps onto.
+        """
+        if len(points) % 3:
+            raise ValueError("points must contain three floats per point.")
+        unique = self._points
+        cells = self._cells
+        inverse_cell = self._inverse_cell
+        tolerance_squared = self._tolerance_squared
+        remap = array("l", bytes(array("l").itemsize * (len(points) // 3)))
+        for p in range(len(points) // 3):
+            x, y, z = points[p * 3], points[p * 3 + 1], points[p * 3 + 2]
+            fx, fy, fz = x * inverse_cell, y * inverse_cell, z * inverse_cell
+            cx, cy, cz = floor(fx), floor(fy), floor(fz)
+            # the tolerance sphere reaches at most the neighbouring cell on the nearer side of each axis.
+            nx = cx - 1 if fx - cx < 0.5 else cx + 1
+            ny = cy - 1 if fy - cy < 0.5 else cy + 1
+            nz = cz - 1 if fz - cz < 0.5 else cz + 1
+            match = -1
+            for key in ((cx, cy, cz), (nx, cy, cz), (cx, ny, cz), (cx, cy, nz),
+                        (nx, ny, cz), (nx, cy, nz), (cx, ny, nz), (nx, ny, nz)):
+                for candidate in cells.get(key, ()):
+                    c = candidate * 3
+                    dx = unique[c] - x
+                    dy = unique[c + 1] - y
+                    dz = unique[c + 2] - z
+                    if dx * dx + dy * dy + dz * dz <= tolerance_squared:
+                        match = candidate
+                        break
+                if match != -1:
+                    break
+            if match == -1:
+                match = len(unique) // 3
+                unique.extend((float(x), float(y), float(z)))
+                cells.setdefault((cx, cy, cz), []).append(match)
+            remap[p] = match
+        return remap
+
+
+def weld(points: Sequence[float], tolerance: float | int) -> tuple[array, array]:
+    """Merge points that lie within tolerance of each other.
+
+    Args:
+        points: flat x, y, z float per point.
+        tolerance: points closer than or equal to this distance are merged.
+
+    Returns:
+        tuple: flat x, y, z array of unique points and an array mapping
+               every incoming point to its unique point index.
+    """
+    welder = Welder(tolerance)
+    remap = welder.add(points)
+    return welder.points, remap
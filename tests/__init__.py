@@ -0,0 +1,5 @@
+
+def all_close(a, b, tolerance=1e-9):
+    """Return True if a and b have the same length and every pair of values is within tolerance."""
+    a, b = list(a), list(b)
+    return len(a) == len(b) and all(abs(x - y) <= tolerance for x, y in zip(a, b))
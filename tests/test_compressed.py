@@ -0,0 +1,95 @@
+from tests import all_close
+
+
+_POINTS = (0.0, 0.0, 0.0,
+           1.0, 2.0, 3.0,
+           -4.0, 0.5, 10.0,
+           2.5, -1.0, 7.0,
+           3.0, 3.0, -3.0)
+
+
+def test_round_trip_within_error_bound():
+    from maths.compressed import CompressedPoints
+    points = CompressedPoints(_POINTS, block_size=2)
+    assert all([len(points) == 5,
+                points.error_bound < 1e-3,
+                all_close(points.decode(), _POINTS, points.error_bound),
+                all_close(points[2].as_tuple(), _POINTS[6:9], points.error_bound)])
+
+
+def test_memory():
+    from array import array
+    from maths.compressed import CompressedPoints
+    floats = array("d", _POINTS * 1000)
+    points = CompressedPoints(floats)
+    assert points.nbytes * 3 < floats.itemsize * len(floats)
+
+
+def test_invalid_bits():
+    import pytest
+    from maths.compressed import CompressedPoints
+    with pytest.raises(ValueError):
+        CompressedPoints(_POINTS, bits=8)
+
+
+def test_transformed():
+    from maths.compressed import CompressedPoints
+    from maths.matrix3 import Matrix3
+    from maths.vector3 import Vector3
+    points = CompressedPoints(_POINTS, bits=32, block_size=2)
+    rotation = Matrix3(0, -1, 0, 1, 0, 0, 0, 0, 1)
+    moved = points.transformed(rotation, Vector3(1, 0, 0))
+    expected = []
+    for i in range(0, len(_POINTS), 3):
+        x, y, z = _POINTS[i:i + 3]
+        expected.extend((1 - y, x, z))
+    assert all_close(moved.decode(), expected, 1e-6)
+
+
+def test_distances_to():
+    from maths.compressed import CompressedPoints
+    from maths.vector3 import Vector3
+    points = CompressedPoints(_POINTS, bits=32)
+    distances = points.distances_to(Vector3(1, 2, 3))
+    assert all_close(distances[:2], (14 ** 0.5, 0.0), 1e-6)
+
+
+def test_normalized():
+    from maths.compressed import CompressedPoints
+    points = CompressedPoints(_POINTS[3:], bits=32).normalized()
+    assert all(abs(points[i].magnitude - 1.0) < 1e-6 for i in range(len(points)))
+
+
+def test_error_bound_carried_through_operations():
+    from maths.compressed import CompressedPoints
+    from maths.matrix3 import Matrix3
+    from maths.vector3 import Vector3
+    rows = Matrix3(1).rotation_matrix((10, 20, 30))
+    rotation = Matrix3(*rows)
+    points = CompressedPoints(_POINTS[3:], block_size=2)
+    moved = points.transformed(rotation, Vector3(1, 1, 1)).transformed(rotation)
+    expected = []
+    for i in range(3, len(_POINTS), 3):
+        p = [sum(rows[r][k] * _POINTS[i + k] for k in range(3)) + 1 for r in range(3)]
+        expected.extend(sum(rows[r][k] * p[k] for k in range(3)) for r in range(3))
+    unit = points.normalized()
+    exact_unit = []
+    for i in range(3, len(_POINTS), 3):
+        x, y, z = _POINTS[i:i + 3]
+        length = (x * x + y * y + z * z) ** 0.5
+        exact_unit.extend((x / length, y / length, z / length))
+    fresh = CompressedPoints(moved.decode(), block_size=2)
+    assert all([moved.error_bound > fresh.error_bound,
+                all_close(moved.decode(), expected, moved.error_bound),
+                unit.error_bound > CompressedPoints(unit.decode(), block_size=2).error_bound,
+                all_close(unit.decode(), exact_unit, unit.error_bound)])
+
+
+def test_normalized_error_bound_ignores_zero_points():
+    from maths.compressed import CompressedPoints
+    with_origin = CompressedPoints((0, 0, 0, 1, 1, 1)).normalized()
+    nearest = CompressedPoints((0, 0, 0, 0.01, 0, 0, 1, 1, 1)).normalized()
+    assert all([with_origin.error_bound < 1e-4,
+                with_origin[0].as_tuple() == (0.0, 0.0, 0.0),
+                all_close(with_origin[1].as_tuple(), (3 ** -0.5,) * 3, with_origin.error_bound),
+                nearest.error_bound > with_origin.error_bound * 50])
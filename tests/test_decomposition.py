@@ -0,0 +1,32 @@
+from tests import all_close
+
+
+def test_svd_reconstructs():
+    from maths.decomposition import svd
+    from maths.matrix3 import Matrix3
+    m = Matrix3(2, -1, 0.5, 0.3, 1, 4, -2, 0.1, 1)
+    u, s, v = svd(m)
+    rebuilt = [sum(u.column(i, k) * s[k] * v.column(j, k) for k in range(3)) for i in range(3) for j in range(3)]
+    assert all([all_close(rebuilt, m.as_list()),
+                abs(u.determinant() - 1.0) < 1e-9,
+                abs(v.determinant() - 1.0) < 1e-9,
+                s[0] >= s[1] >= abs(s[2])])
+
+
+def test_svd_reflection():
+    from maths.decomposition import svd
+    from maths.matrix3 import Matrix3
+    _, s, _ = svd(Matrix3(1, 1, -1))
+    assert all_close(s, (1.0, 1.0, -1.0))
+
+
+def test_polar():
+    from maths.decomposition import polar
+    from maths.matrix3 import Matrix3
+    rotation = Matrix3(*Matrix3(1).rotation_matrix((10, 20, 30)))
+    stretch = Matrix3(2, 0.5, 0, 0.5, 1, 0, 0, 0, 3)
+    m = Matrix3(*[sum(rotation.column(i, k) * stretch.column(k, j) for k in range(3))
+                  for i in range(3) for j in range(3)])
+    r, p = polar(m)
+    assert all([all_close(r.as_list(), rotation.as_list()),
+                all_close(p.as_list(), stretch.as_list())])
@@ -0,0 +1,69 @@
+
+def test_frozen_vector3_hash_and_eq():
+    from maths.frozen import FrozenVector3
+    a = FrozenVector3(1, 2, 3)
+    b = FrozenVector3((1.0, 2.0, 3.0))
+    cache = {a: "a"}
+    assert all([a == b,
+                hash(a) == hash(b),
+                cache[b] == "a",
+                a != FrozenVector3(1, 2, 4)])
+
+
+def test_frozen_vector3_immutable():
+    import pytest
+    from maths.frozen import FrozenVector3
+    a = FrozenVector3(1, 2, 3)
+    with pytest.raises(AttributeError):
+        a.x = 5.0
+
+
+def test_frozen_vector3_conversion():
+    from maths.frozen import FrozenVector3
+    from maths.vector3 import Vector3
+    v = Vector3(1, 2, 3)
+    f = FrozenVector3.from_vector3(v)
+    back = f.to_vector3()
+    back.x = 10.0
+    assert all([f.as_tuple() == (1.0, 2.0, 3.0),
+                isinstance(back, Vector3),
+                f.x == 1.0])
+
+
+def test_frozen_vector3_arithmetic():
+    from maths.frozen import FrozenVector3
+    a = FrozenVector3(1, 0, 0)
+    b = FrozenVector3(0, 1, 0)
+    assert all([(a + b).as_tuple() == (1.0, 1.0, 0.0),
+                (a - b).as_tuple() == (1.0, -1.0, 0.0),
+                (a * 2).as_tuple() == (2.0, 0.0, 0.0),
+                a.cross(b) == FrozenVector3.Z_AXIS,
+                a.dot(b) == 0.0])
+
+
+def test_intern():
+    from maths.frozen import FrozenVector3, FrozenMatrix3
+    from maths.vector3 import Vector3
+    from maths.matrix3 import Matrix3
+    a = FrozenVector3(7, 8, 9).intern()
+    b = FrozenVector3(7, 8, 9).intern()
+    axis = FrozenVector3.from_vector3(Vector3(1, 0, 0), intern=True)
+    identity = FrozenMatrix3.from_matrix3(Matrix3(1), intern=True)
+    assert all([a is b,
+                axis is FrozenVector3.X_AXIS,
+                identity is FrozenMatrix3.IDENTITY])
+
+
+def test_frozen_matrix3():
+    import pickle
+    from maths.frozen import FrozenMatrix3
+    from maths.matrix3 import Matrix3
+    m = FrozenMatrix3(1, 2, 3, 4, 5, 6, 7, 8, 10)
+    assert all([m == FrozenMatrix3.from_matrix3(m.to_matrix3()),
+                isinstance(m.to_matrix3(), Matrix3),
+                m.row_2 == (4.0, 5.0, 6.0),
+                m.column(2, 2) == 10.0,
+                m.determinant() == -3.0,
+                m.transpose().row_1 == (1.0, 4.0, 7.0),
+                pickle.loads(pickle.dumps(m)) == m,
+                len({m, FrozenMatrix3(1, 2, 3, 4, 5, 6, 7, 8, 10)}) == 1])
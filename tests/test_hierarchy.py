@@ -0,0 +1,101 @@
+from tests import all_close
+
+
+def test_add_node():
+    from maths.hierarchy import TransformHierarchy
+    h = TransformHierarchy()
+    root = h.add_node()
+    child = h.add_node(root)
+    grandchild = h.add_node(child)
+    assert all([len(h) == 3,
+                h.parent(root) == -1,
+                h.parent(grandchild) == child,
+                h.children(root) == (child,),
+                h.depth(grandchild) == 2])
+
+
+def test_add_node_invalid_parent():
+    import pytest
+    from maths.hierarchy import TransformHierarchy
+    h = TransformHierarchy()
+    with pytest.raises(IndexError):
+        h.add_node(0)
+
+
+def test_world_translation():
+    from maths.hierarchy import TransformHierarchy
+    from maths.vector3 import Vector3
+    h = TransformHierarchy()
+    root = h.add_node(rotation=(0, 0, 90), translation=Vector3(1, 0, 0))
+    child = h.add_node(root, translation=Vector3(1, 0, 0))
+    assert all_close(h.world_translation(child).as_tuple(), (1.0, 1.0, 0.0))
+
+
+def test_world_matrix_matches_rotation_matrix():
+    from maths.hierarchy import TransformHierarchy
+    h = TransformHierarchy()
+    root = h.add_node(rotation=(0, 0, 45))
+    child = h.add_node(root, rotation=(0, 0, 45))
+    assert all_close(h.world_matrix(child).as_list(), (0.0, -1.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0))
+
+
+def test_update_only_dirty_subtree():
+    from maths.hierarchy import TransformHierarchy
+    from maths.vector3 import Vector3
+    h = TransformHierarchy()
+    root = h.add_node()
+    left = h.add_node(root)
+    right = h.add_node(root)
+    leaf = h.add_node(left)
+    assert h.update() == 4
+    assert h.update() == 0
+    h.set_local_translation(left, Vector3(0, 2, 0))
+    assert all([h.is_dirty(leaf),
+                not h.is_dirty(right),
+                h.update() == 2,
+                h.world_translation(leaf).as_tuple() == (0.0, 2.0, 0.0),
+                h.world_translation(right).as_tuple() == (0.0, 0.0, 0.0)])
+
+
+def test_invalid_index():
+    import pytest
+    from maths.hierarchy import TransformHierarchy
+    from maths.matrix3 import Matrix3
+    from maths.vector3 import Vector3
+    h = TransformHierarchy()
+    root = h.add_node()
+    h.add_node(root)
+    for index in (2, 5, -1):
+        with pytest.raises(IndexError):
+            h.set_local_translation(index, Vector3(1, 2, 3))
+        with pytest.raises(IndexError):
+            h.set_local_rotation(index, (0, 0, 90))
+        with pytest.raises(IndexError):
+            h.set_local_matrix(index, Matrix3(1))
+        with pytest.raises(IndexError):
+            h.local_matrix(index)
+        with pytest.raises(IndexError):
+            h.world_matrix(index)
+    assert all([len(h._local_translations) == 6,
+                len(h._local_rotations) == 18,
+                h.world_translation(1).as_tuple() == (0.0, 0.0, 0.0)])
+
+
+def test_failed_add_node_leaves_hierarchy_unchanged():
+    import pytest
+    from maths.errors import Vector3ArgumentError
+    from maths.hierarchy import TransformHierarchy
+    from maths.vector3 import Vector3
+    h = TransformHierarchy()
+    root = h.add_node(translation=Vector3(5, 0, 0))
+    h.add_node(root, translation=Vector3(0, 1, 0))
+    h.update()
+    with pytest.raises(ValueError):
+        h.add_node(root, rotation=(0, 0, 0), rotation_order="yzx")
+    with pytest.raises(Vector3ArgumentError):
+        h.add_node(root, translation=(1, 2, 3))
+    assert all([len(h) == 2,
+                h.children(root) == (1,),
+                len(h._world_translations) == 6,
+                not h.is_dirty(1),
+                h.world_translation(1).as_tuple() == (5.0, 1.0, 0.0)])
@@ -0,0 +1,9 @@
+
+def test_rotation_matrix_is_orthonormal():
+    from maths.matrix3 import Matrix3
+    for order in ("zyx", "xyz"):
+        rows = Matrix3(1).rotation_matrix((30, -45, 60), rotation_order=order)
+        m = Matrix3(*rows)
+        product = [sum(rows[i][k] * rows[j][k] for k in range(3)) for i in range(3) for j in range(3)]
+        assert all([abs(m.determinant() - 1.0) < 1e-9,
+                    all(abs(a - b) < 1e-9 for a, b in zip(product, Matrix3(1).as_list()))])
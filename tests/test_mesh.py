@@ -0,0 +1,81 @@
+from tests import all_close
+
+
+# unit square in the xy plane split into two triangles.
+_SQUARE_VERTICES = (0, 0, 0, 1, 0, 0, 1, 1, 0, 0, 1, 0)
+_SQUARE_INDICES = (0, 1, 2, 0, 2, 3)
+_SQUARE_UVS = (0, 0, 1, 0, 1, 1, 0, 1)
+
+
+def test_face_normals():
+    from maths.mesh import face_normals
+    normals = face_normals(_SQUARE_VERTICES, _SQUARE_INDICES)
+    assert all_close(normals, (0, 0, 1, 0, 0, 1))
+
+
+def test_vertex_normals_weighting():
+    from maths.mesh import vertex_normals
+    # two triangles folded 90 degrees along the x axis, vertex 0 and 1 are shared.
+    vertices = (0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 2)
+    indices = (0, 1, 2, 1, 0, 3)
+    area = vertex_normals(vertices, indices, weighting="area")
+    angle = vertex_normals(vertices, indices, weighting="angle")
+    uniform = vertex_normals(vertices, indices, weighting="uniform")
+    half = 0.5 ** 0.5
+    assert all([all_close(uniform[0:3], (0, half, half)),
+                all_close(angle[0:3], (0, half, half)),
+                area[1] > half,
+                all_close(area[6:9], (0, 0, 1))])
+
+
+def test_vertex_normals_invalid_weighting():
+    import pytest
+    from maths.mesh import vertex_normals
+    with pytest.raises(ValueError):
+        vertex_normals(_SQUARE_VERTICES, _SQUARE_INDICES, weighting="bad")
+
+
+def test_vertex_tangents():
+    from maths.mesh import vertex_normals, vertex_tangents
+    normals = vertex_normals(_SQUARE_VERTICES, _SQUARE_INDICES)
+    tangents = vertex_tangents(_SQUARE_VERTICES, normals, _SQUARE_UVS, _SQUARE_INDICES)
+    assert all_close(tangents, (1, 0, 0, 1) * 4)
+
+
+def test_mesh_normals_move_vertices():
+    from maths.mesh import MeshNormals, vertex_normals
+    vertices = (0, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 2, 5, 5, 0, 6, 5, 0, 5, 6, 0)
+    indices = (0, 1, 2, 1, 0, 3, 4, 5, 6)
+    mesh = MeshNormals(vertices, indices)
+    assert all_close(mesh.normals, vertex_normals(vertices, indices))
+    updated = mesh.move_vertices((3,), (0, 0, 0.5))
+    moved = list(vertices)
+    moved[9:12] = (0, 0, 0.5)
+    assert all([updated == [0, 1, 3],
+                all_close(mesh.normals, vertex_normals(moved, indices))])
+
+
+def test_mesh_normals_move_invalid_vertex():
+    import pytest
+    from maths.mesh import MeshNormals
+    mesh = MeshNormals(_SQUARE_VERTICES, _SQUARE_INDICES)
+    before = list(mesh.vertices)
+    for moved in ((4,), (-1,), (0, 7)):
+        with pytest.raises(IndexError):
+            mesh.move_vertices(moved, (9, 9, 9) * len(moved))
+    assert list(mesh.vertices) == before
+
+
+def test_invalid_triangle_index():
+    import pytest
+    from maths.mesh import MeshNormals, face_normals, vertex_normals, vertex_tangents
+    normals = vertex_normals(_SQUARE_VERTICES, _SQUARE_INDICES)
+    for indices in ((0, 1, -2), (0, 1, 4), (0, 1, 2, 0, 2, 9)):
+        with pytest.raises(IndexError):
+            face_normals(_SQUARE_VERTICES, indices)
+        with pytest.raises(IndexError):
+            vertex_normals(_SQUARE_VERTICES, indices)
+        with pytest.raises(IndexError):
+            vertex_tangents(_SQUARE_VERTICES, normals, _SQUARE_UVS, indices)
+        with pytest.raises(IndexError):
+            MeshNormals(_SQUARE_VERTICES, indices)
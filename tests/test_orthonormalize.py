@@ -0,0 +1,68 @@
+
+def _drifted():
+    from maths.matrix3 import Matrix3
+    rows = Matrix3(1).rotation_matrix((20, 40, 60))
+    return Matrix3(*[v * (1.0 + 0.01 * i) for i, v in enumerate(v for row in rows for v in row)])
+
+
+def test_orthogonality_error():
+    from maths.matrix3 import Matrix3
+    from maths.orthonormalize import orthogonality_error
+    assert all([orthogonality_error(Matrix3(1)) == 0.0,
+                abs(orthogonality_error(Matrix3(2)) - 3 ** 0.5 * 3) < 1e-12,
+                orthogonality_error(_drifted()) > 0.01])
+
+
+def test_orthonormalize_modes():
+    from maths.orthonormalize import orthogonality_error, orthonormalize
+    for mode in ("gram_schmidt", "polar"):
+        matrices = [_drifted(), _drifted()]
+        count = orthonormalize(matrices, mode=mode)
+        assert all([count == 2,
+                    all(orthogonality_error(m) < 1e-12 for m in matrices),
+                    all(abs(m.determinant() - 1.0) < 1e-12 for m in matrices)])
+
+
+def test_orthonormalize_tolerance():
+    from maths.matrix3 import Matrix3
+    from maths.orthonormalize import orthonormalize
+    identity = Matrix3(1)
+    drifted = _drifted()
+    assert all([orthonormalize([identity, drifted], tolerance=1e-6) == 1,
+                identity.as_list() == Matrix3(1).as_list()])
+
+
+def test_orthonormalize_invalid_mode():
+    import pytest
+    from maths.orthonormalize import orthonormalize
+    with pytest.raises(ValueError):
+        orthonormalize([_drifted()], mode="bad")
+
+
+def test_orthonormalize_flat():
+    from array import array
+    from maths.matrix3 import Matrix3
+    from maths.orthonormalize import orthogonality_error, orthonormalize_flat
+    values = array("d", _drifted().as_list() * 3)
+    count = orthonormalize_flat(values, mode="polar")
+    assert all([count == 3,
+                orthogonality_error(Matrix3(*values[9:18])) < 1e-12])
+
+
+def test_orthonormalize_degenerate_rows():
+    from array import array
+    from maths.matrix3 import Matrix3
+    from maths.orthonormalize import orthogonality_error, orthonormalize_flat
+    degenerate = ((1, 0, 0, 2, 0, 0, 0, 0, 1),
+                  (0, 0, 0, 0, 1, 0, 0, 0, 1),
+                  (1, 0, 0, 1, 0, 0, 1, 0, 0),
+                  (0, 0, 0, 0, 0, 0, 0, 0, 0))
+    for mode in ("gram_schmidt", "polar"):
+        values = array("d", [v for m in degenerate for v in m])
+        assert orthonormalize_flat(values, mode=mode) == 4
+        matrices = [Matrix3(*values[i:i + 9]) for i in range(0, len(values), 9)]
+        assert all([all(orthogonality_error(m) < 1e-12 for m in matrices),
+                    all(abs(m.determinant() - 1.0) < 1e-12 for m in matrices)])
+    values = array("d", degenerate[0])
+    orthonormalize_flat(values)
+    assert list(values) == [1, 0, 0, 0, 1, 0, 0, 0, 1]
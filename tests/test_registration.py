@@ -0,0 +1,75 @@
+from tests import all_close
+
+
+_SOURCE = (0, 0, 0, 1, 0, 0, 0, 2, 0, 0, 0, 3, 1, 1, 1)
+
+
+def _transform(points, rows, offset):
+    out = []
+    for i in range(0, len(points), 3):
+        p = points[i:i + 3]
+        out.extend(sum(rows[r][k] * p[k] for k in range(3)) + offset[r] for r in range(3))
+    return out
+
+
+def test_register():
+    from maths.matrix3 import Matrix3
+    from maths.registration import register
+    rows = Matrix3(1).rotation_matrix((30, -45, 60))
+    target = _transform(_SOURCE, rows, (1, 2, 3))
+    result = register(_SOURCE, target)
+    assert all([all_close(result.rotation.as_list(), [v for row in rows for v in row]),
+                all_close(result.translation.as_tuple(), (1, 2, 3)),
+                result.rmsd < 1e-6])
+
+
+def test_register_reflection_gives_rotation():
+    from maths.registration import register
+    mirrored = _transform(_SOURCE, ((-1, 0, 0), (0, 1, 0), (0, 0, 1)), (0, 0, 0))
+    result = register(_SOURCE, mirrored)
+    assert all([abs(result.rotation.determinant() - 1.0) < 1e-9,
+                result.rmsd > 0.1])
+
+
+def test_cross_covariance_chunks():
+    from maths.matrix3 import Matrix3
+    from maths.registration import CrossCovariance, register
+    rows = Matrix3(1).rotation_matrix((5, 10, 15))
+    target = _transform(_SOURCE, rows, (0, -1, 0))
+    first = CrossCovariance()
+    first.add(_SOURCE[:6], target[:6])
+    second = CrossCovariance()
+    second.add(_SOURCE[6:], target[6:])
+    merged = first.merge(second).solve()
+    whole = register(_SOURCE, target)
+    assert all([len(first) == 5,
+                all_close(merged.rotation.as_list(), whole.rotation.as_list()),
+                all_close(merged.translation.as_tuple(), whole.translation.as_tuple())])
+
+
+def test_register_many():
+    from maths.registration import register_many
+    shifted = [v + 1 for v in _SOURCE]
+    results = register_many([(_SOURCE, _SOURCE), (_SOURCE, shifted)])
+    assert all([len(results) == 2,
+                all_close(results[1].translation.as_tuple(), (1, 1, 1))])
+
+
+def test_register_far_from_origin():
+    import random
+    from maths.matrix3 import Matrix3
+    from maths.registration import CrossCovariance, register
+    generator = random.Random(7)
+    rows = Matrix3(1).rotation_matrix((30, -45, 60))
+    source = [generator.uniform(-1, 1) + 1e5 for _ in range(60)]
+    target = _transform(source, rows, (5, -5, 5))
+    expected = [v for row in rows for v in row]
+    whole = register(source, target)
+    chunked = CrossCovariance()
+    chunked.add(source[:21], target[:21])
+    chunked.add(source[21:], target[21:])
+    chunked = chunked.solve()
+    assert all([all_close(whole.rotation.as_list(), expected, 1e-9),
+                all_close(chunked.rotation.as_list(), expected, 1e-9),
+                whole.rmsd < 1e-8,
+                chunked.rmsd < 1e-6])
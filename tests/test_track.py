@@ -0,0 +1,87 @@
+from tests import all_close
+
+
+def test_linear_sample():
+    from maths.track import Vector3Track
+    from maths.vector3 import Vector3
+    track = Vector3Track((0, 1, 3), (Vector3(0, 0, 0), Vector3(1, 0, 0), Vector3(1, 2, 0)))
+    assert all([all_close(track.sample(0.5).as_tuple(), (0.5, 0.0, 0.0)),
+                all_close(track.sample(2.0).as_tuple(), (1.0, 1.0, 0.0)),
+                all_close(track.sample(-1.0).as_tuple(), (0.0, 0.0, 0.0)),
+                all_close(track.sample(10.0).as_tuple(), (1.0, 2.0, 0.0))])
+
+
+def test_hermite_matches_keys_and_tangents():
+    from maths.track import Vector3Track
+    from maths.vector3 import Vector3
+    # tangents differ from the chord slope (1) and the segment lasts 2 time units.
+    p0, p1, m0, m1 = Vector3(0, 0, 0), Vector3(2, 1, 0), Vector3(0, -1, 0), Vector3(3, 2, 0)
+    track = Vector3Track((1, 3), (p0, p1), interpolation="hermite", tangents=(m0, m1))
+
+    def hermite(t):
+        d = 2.0
+        u = (t - 1.0) / d
+        h00, h10 = 2 * u ** 3 - 3 * u ** 2 + 1, u ** 3 - 2 * u ** 2 + u
+        h01, h11 = -2 * u ** 3 + 3 * u ** 2, u ** 3 - u ** 2
+        return [h00 * a + h10 * d * b + h01 * c + h11 * d * e
+                for a, b, c, e in zip(p0.as_tuple(), m0.as_tuple(), p1.as_tuple(), m1.as_tuple())]
+
+    h = 1e-6
+    start_slope = [(a - b) / h for a, b in zip(track.sample(1 + h).as_tuple(), track.sample(1).as_tuple())]
+    end_slope = [(a - b) / h for a, b in zip(track.sample(3).as_tuple(), track.sample(3 - h).as_tuple())]
+    assert all([all_close(track.sample(1).as_tuple(), p0.as_tuple()),
+                all_close(track.sample(3).as_tuple(), p1.as_tuple()),
+                all_close(track.sample(2).as_tuple(), (0.25, -0.25, 0.0)),
+                all_close(track.sample(2).as_tuple(), hermite(2)),
+                all_close(track.sample(1.5).as_tuple(), hermite(1.5)),
+                all_close(start_slope, m0.as_tuple(), 1e-4),
+                all_close(end_slope, m1.as_tuple(), 1e-4)])
+
+
+def test_hermite_requires_tangents():
+    import pytest
+    from maths.track import Vector3Track
+    from maths.vector3 import Vector3
+    with pytest.raises(ValueError):
+        Vector3Track((0, 1), (Vector3(0), Vector3(1)), interpolation="hermite")
+
+
+def test_catmull_rom_passes_through_keys():
+    from maths.track import Vector3Track
+    from maths.vector3 import Vector3
+    values = (Vector3(0, 0, 0), Vector3(1, 1, 0), Vector3(2, 0, 0), Vector3(3, 1, 0))
+    track = Vector3Track((0, 1, 2, 4), values, interpolation="catmull_rom")
+    assert all(all_close(track.sample(t).as_tuple(), v.as_tuple()) for t, v in zip((0, 1, 2, 4), values))
+
+
+def test_sample_many_matches_sample():
+    from maths.track import Vector3Track
+    from maths.vector3 import Vector3
+    values = (Vector3(0, 0, 0), Vector3(1, 1, 0), Vector3(2, 0, 0), Vector3(3, 1, 0))
+    track = Vector3Track((0, 1, 2, 4), values, interpolation="catmull_rom")
+    times = (3.5, 0.25, 1.5, -1.0, 2.0, 5.0)
+    batch = track.sample_many(times)
+    assert all(all_close(batch[i * 3:i * 3 + 3], track.sample(t).as_tuple()) for i, t in enumerate(times))
+
+
+def test_rotation_track_slerp():
+    from maths.matrix3 import Matrix3
+    from maths.track import RotationTrack
+    a = Matrix3(*Matrix3(1).rotation_matrix((0, 0, 0)))
+    b = Matrix3(*Matrix3(1).rotation_matrix((0, 0, 90)))
+    track = RotationTrack((0, 1), (a, b))
+    expected = Matrix3(1).rotation_matrix((0, 0, 45))
+    assert all_close(track.sample(0.5).as_list(), [v for row in expected for v in row])
+
+
+def test_sample_tracks():
+    from maths.matrix3 import Matrix3
+    from maths.track import RotationTrack, Vector3Track, sample_tracks
+    from maths.vector3 import Vector3
+    position = Vector3Track((0, 1), (Vector3(0), Vector3(1)))
+    rotation = RotationTrack((0, 1), (Matrix3(1), Matrix3(*Matrix3(1).rotation_matrix((90, 0, 0)))))
+    positions, rotations = sample_tracks((position, rotation), (1.0, 0.0, 0.5))
+    assert all([len(positions) == 9,
+                len(rotations) == 27,
+                all_close(positions, (1.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.5, 0.5, 0.5)),
+                all_close(rotations[9:18], Matrix3(1).as_list())])
@@ -152,3 +152,12 @@ def test_angle_to():
     ac_angle = a.angle_to(c)
     assert all([ab_angle == 90,
                 ac_angle == 45])
+
+
+def test_is_close():
+    from maths.vector3 import Vector3
+    a = Vector3(0, 0, 1)
+    b = Vector3(0, 0, 1.0005)
+    assert all([a.is_close(b, tolerance=0.001),
+                not a.is_close(b),
+                a.is_close(Vector3(0, 0, 1))])
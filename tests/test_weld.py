@@ -0,0 +1,39 @@
+
+def test_weld():
+    from maths.weld import weld
+    points = (0, 0, 0,
+              1, 0, 0,
+              0.0005, 0, 0,
+              1, 0.0009, 0,
+              0, 0, 1)
+    unique, remap = weld(points, 0.001)
+    assert all([list(unique) == [0, 0, 0, 1, 0, 0, 0, 0, 1],
+                list(remap) == [0, 1, 0, 1, 2]])
+
+
+def test_weld_across_cell_boundary():
+    from maths.weld import weld
+    # both points sit either side of the 0.0 grid line.
+    unique, remap = weld((-0.0001, 0, 0, 0.0001, 0, 0), 0.001)
+    assert all([len(unique) == 3,
+                list(remap) == [0, 0]])
+
+
+def test_welder_streaming():
+    from maths.weld import Welder
+    welder = Welder(0.01)
+    first = welder.add((0, 0, 0, 5, 5, 5))
+    second = welder.add((5.001, 5, 5, 9, 9, 9))
+    assert all([list(first) == [0, 1],
+                list(second) == [1, 2],
+                len(welder) == 3])
+
+
+def test_welder_invalid_tolerance():
+    import pytest
+    from maths.errors import NumTypeArgumentError
+    from maths.weld import Welder
+    with pytest.raises(ValueError):
+        Welder(0)
+    with pytest.raises(NumTypeArgumentError):
+        Welder("0.1")